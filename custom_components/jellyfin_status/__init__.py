@@ -1,14 +1,17 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
 import logging
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.storage import Store
 
 from .coordinator import JellyfinCoordinator
-from .const import DOMAIN
-from .discovery import get_jellyfin_sensor_entity_ids
+from .websocket import JellyfinWebSocket
+from .const import DOMAIN, DEFAULT_COUNTS_INTERVAL, DEFAULT_REGISTRY_REFRESH_WINDOW, STORAGE_VERSION
+from .discovery import async_get_entity_index
+from .capture import write_fixture
 
 _LOGGER = logging.getLogger(__name__)
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
@@ -26,11 +29,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     scan_interval = get_opt("scan_interval", 30)
     use_https = get_opt("use_https", False)
     ignore_ssl = get_opt("ignore_ssl", False)
+    counts_interval = get_opt("counts_interval", DEFAULT_COUNTS_INTERVAL)
+    use_websocket = get_opt("use_websocket", False)
+    registry_refresh_window = get_opt("registry_refresh_window", DEFAULT_REGISTRY_REFRESH_WINDOW)
+    adaptive_polling = get_opt("adaptive_polling", False)
+    library_stats = get_opt("library_stats", False)
 
     update_interval = None if scan_interval == 0 else timedelta(seconds=scan_interval)
 
     _LOGGER.info("🔧 Configured scan_interval: %s", scan_interval)
     _LOGGER.info("⏱️ Polling enabled: %s", update_interval is not None)
+    _LOGGER.info("🐢 Adaptive polling: %s", adaptive_polling)
+    _LOGGER.info("📚 Library counts interval (minutes): %s", counts_interval or "manual")
 
     coordinator = JellyfinCoordinator(
         hass=hass,
@@ -39,10 +49,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         address=f"{host}:{port}",
         update_interval=update_interval,
         use_https=use_https,
-        ignore_ssl=ignore_ssl
+        ignore_ssl=ignore_ssl,
+        counts_interval=timedelta(minutes=counts_interval) if counts_interval else None,
+        adaptive_polling=adaptive_polling,
+        library_stats=library_stats,
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    if await coordinator.async_restore():
+        # 🗄️ Entities start from the stored snapshot; the first live poll runs in the background
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh {entry.entry_id}"
+        )
+    else:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            # Setup will be retried with a new coordinator; give back the shared client
+            await coordinator.async_close()
+            raise
+
+    # 📡 Push mode: sessions over WebSocket, REST polling as fallback
+    if use_websocket:
+        coordinator.websocket = JellyfinWebSocket(hass, coordinator, device_id=f"{DOMAIN}_{entry.entry_id}")
+        coordinator.websocket.start(entry)
 
     domain_data = hass.data.setdefault(DOMAIN, {})
     domain_data[entry.entry_id] = coordinator
@@ -53,15 +82,48 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # 🔄 Manual refresh service
     async def handle_refresh(call):
+        # A manual refresh also re-reads endpoints that are on a slower cadence
+        coordinator.request_endpoints()
         await coordinator.async_request_refresh()
     hass.services.async_register(DOMAIN, "refresh", handle_refresh)
 
-    # 🔊 Listen for entity registry updates
-    def handle_registry_event(event):
-        _LOGGER.debug("🔄 Entity registry updated, refreshing Jellyfin sensors...")
-        hass.loop.call_soon_threadsafe(lambda: hass.async_create_task(coordinator.async_request_refresh()))
-    
-    coordinator._unsub_registry = hass.bus.async_listen(EVENT_ENTITY_REGISTRY_UPDATED, handle_registry_event)
+    # 💾 Dump captured payloads (debug_payloads) of every entry to replay fixtures
+    if not hass.services.has_service(DOMAIN, "dump_payloads"):
+        async def handle_dump_payloads(call):
+            dumped = False
+            for entry_id, entry_coordinator in list(hass.data.get(DOMAIN, {}).items()):
+                if not isinstance(entry_coordinator, JellyfinCoordinator) or entry_coordinator.capture is None:
+                    continue
+                config_entry = hass.config_entries.async_get_entry(entry_id)
+                server = config_entry.title if config_entry else entry_id
+                path = hass.config.path(
+                    DOMAIN, f"payloads_{entry_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+                )
+                entries = entry_coordinator.capture.snapshot()
+                await hass.async_add_executor_job(write_fixture, path, server, entries)
+                _LOGGER.info("💾 Dumped %s captured Jellyfin payloads to %s", len(entries), path)
+                dumped = True
+            if not dumped:
+                _LOGGER.warning("💾 No Jellyfin payloads to dump — enable 'Debug payloads' in the integration options")
+        hass.services.async_register(DOMAIN, "dump_payloads", handle_dump_payloads)
+
+    # 🔊 Refresh when this entry's entities change in the registry; bursts are
+    # merged into a single refresh per window
+    coordinator._registry_debouncer = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=registry_refresh_window,
+        immediate=False,
+        function=coordinator.async_request_refresh,
+    )
+
+    @callback
+    def handle_registry_event(config_entry_ids):
+        if entry.entry_id in config_entry_ids:
+            _LOGGER.debug("🔄 Jellyfin entities changed in the registry, scheduling refresh...")
+            hass.async_create_task(coordinator._registry_debouncer.async_call())
+
+    coordinator._unsub_registry = async_get_entity_index(hass).async_add_listener(handle_registry_event)
 
     # 🚀 Forward platform setup
     await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
@@ -78,10 +140,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if coordinator and hasattr(coordinator, "_unsub_registry"):
         coordinator._unsub_registry()
         coordinator._unsub_registry = None
+        coordinator._registry_debouncer.async_cancel()
+
+    if coordinator and coordinator.websocket:
+        await coordinator.websocket.async_stop()
 
     await coordinator.async_close()
     return await hass.config_entries.async_unload_platforms(entry, ["sensor"])
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    # Drop the stored warm-start snapshot along with the entry
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
+
 async def async_update_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await async_unload_entry(hass, entry)
     await async_setup_entry(hass, entry)
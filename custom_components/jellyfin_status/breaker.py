@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+
+import aiohttp
+
+from .const import BREAKER_THRESHOLD, BREAKER_AUTH_THRESHOLD, BREAKER_PROBE_DELAYS, BREAKER_PROBE_MAX
+
+_LOGGER = logging.getLogger(__name__)
+
+FAILURE_AUTH = "auth"
+FAILURE_TIMEOUT = "timeout"
+FAILURE_CONNECT = "connect"
+FAILURE_ERROR = "error"
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+def classify_error(err: Exception) -> str:
+    """Sort a fetch failure into the kinds the breaker treats differently."""
+    if isinstance(err, aiohttp.ClientResponseError) and err.status in (401, 403):
+        return FAILURE_AUTH
+    if isinstance(err, asyncio.TimeoutError):
+        return FAILURE_TIMEOUT
+    if isinstance(err, (aiohttp.ClientConnectionError, OSError)):
+        return FAILURE_CONNECT
+    return FAILURE_ERROR
+
+
+def describe_error(err: Exception) -> str:
+    """Short error text for logs and attributes; response errors keep only the status and path.
+
+    The full request URL carries the API key, so it must never be logged.
+    """
+    if isinstance(err, aiohttp.ClientResponseError):
+        url = getattr(err.request_info, "url", None)
+        path = f" ({url.path})" if url is not None else ""
+        return f"HTTP {err.status} {err.message}{path}"
+    return f"{type(err).__name__}: {err}" if str(err) else type(err).__name__
+
+
+class CircuitBreaker:
+    """Stops polling an unreachable server and probes it on a growing schedule.
+
+    closed → open after BREAKER_THRESHOLD failures in a row (BREAKER_AUTH_THRESHOLD
+    rejected API keys in a row);
+    open → half_open once the next probe is due; half_open → closed on
+    success, or back to open with double the wait on failure.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self._auth_failures = 0
+        self.failure_kind = None
+        self.last_error = None
+        self.next_probe = None  # monotonic time
+        self.next_probe_at = None  # wall clock, for display
+        self._probe_delay = None
+
+    @property
+    def closed(self) -> bool:
+        return self.state == STATE_CLOSED
+
+    def probe_due(self, now: float) -> bool:
+        return self.state == STATE_OPEN and now >= self.next_probe
+
+    def seconds_to_probe(self, now: float):
+        if self.state != STATE_OPEN:
+            return None
+        return max(self.next_probe - now, 0)
+
+    def start_probe(self) -> None:
+        self.state = STATE_HALF_OPEN
+
+    def record_success(self) -> None:
+        if not self.closed:
+            _LOGGER.info("✅ %s reachable again after %s failures, resuming polling", self.name, self.failures)
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self._auth_failures = 0
+        self.failure_kind = None
+        self.next_probe = self.next_probe_at = self._probe_delay = None
+
+    def record_failure(self, err: Exception) -> str:
+        """Count a failure and open the breaker when due; returns the failure kind."""
+        kind = classify_error(err)
+        self.failures += 1
+        self._auth_failures = self._auth_failures + 1 if kind == FAILURE_AUTH else 0
+        self.failure_kind = kind
+        self.last_error = describe_error(err)
+
+        if self.state == STATE_HALF_OPEN:
+            self._probe_delay = min(self._probe_delay * 2, BREAKER_PROBE_MAX)
+            _LOGGER.debug("%s probe failed (%s), next probe in %ss", self.name, kind, self._probe_delay)
+        elif self.state == STATE_CLOSED and (
+            self._auth_failures >= BREAKER_AUTH_THRESHOLD or self.failures >= BREAKER_THRESHOLD
+        ):
+            self._probe_delay = BREAKER_PROBE_DELAYS[kind]
+            _LOGGER.warning(
+                "🚧 %s unavailable (%s) after %s failures — pausing requests, probing every %ss and up",
+                self.name, kind, self.failures, self._probe_delay,
+            )
+        else:
+            return kind
+
+        self.state = STATE_OPEN
+        self.next_probe = time.monotonic() + self._probe_delay
+        self.next_probe_at = (datetime.now() + timedelta(seconds=self._probe_delay)).isoformat()
+        return kind
+
+    def as_dict(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "failure_kind": self.failure_kind,
+            "last_error": self.last_error,
+            "next_probe": self.next_probe_at,
+        }
@@ -0,0 +1,60 @@
+import json
+import os
+from collections import deque
+from datetime import datetime
+
+from .const import CAPTURE_SIZE, CAPTURE_SAMPLE_EVERY, CAPTURE_MAX_BYTES
+
+FIXTURE_VERSION = 1
+
+
+class PayloadCapture:
+    """Ring buffer of sampled raw payloads with their fetch timings.
+
+    Bodies are kept exactly as received and only decoded when dumped, so
+    capturing costs a reference per sampled payload rather than a log line.
+    """
+
+    def __init__(self, maxlen: int = CAPTURE_SIZE, sample_every: int = CAPTURE_SAMPLE_EVERY, max_bytes: int = CAPTURE_MAX_BYTES):
+        self.sample_every = sample_every
+        self.max_bytes = max_bytes
+        self._entries = deque(maxlen=maxlen)
+        self._seen = {}  # endpoint -> payloads seen, for sampling
+        self._bytes = 0
+
+    def add(self, endpoint: str, body, latency_ms: float | None = None, decode_ms: float | None = None) -> None:
+        seen = self._seen.get(endpoint, 0)
+        self._seen[endpoint] = seen + 1
+        if seen % self.sample_every:
+            return
+
+        if len(self._entries) == self._entries.maxlen:
+            self._bytes -= len(self._entries[0]["body"])
+        self._entries.append({
+            "time": datetime.now().isoformat(),
+            "endpoint": endpoint,
+            "bytes": len(body),
+            "latency_ms": round(latency_ms, 2) if latency_ms is not None else None,
+            "decode_ms": round(decode_ms, 2) if decode_ms is not None else None,
+            "body": body,
+        })
+        self._bytes += len(body)
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            self._bytes -= len(self._entries.popleft()["body"])
+
+    def snapshot(self) -> list[dict]:
+        """The captured entries, oldest first (call on the event loop)."""
+        return list(self._entries)
+
+
+def write_fixture(path: str, server: str, entries: list[dict]) -> None:
+    """Write captured entries as a replay fixture (blocking; run in the executor)."""
+    captured = []
+    for entry in entries:
+        record = {key: value for key, value in entry.items() if key != "body"}
+        record["payload"] = json.loads(entry["body"])
+        captured.append(record)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": FIXTURE_VERSION, "server": server, "captured": captured}, f, indent=2)
@@ -0,0 +1,85 @@
+import logging
+
+import aiohttp
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.ssl import client_context, create_no_verify_ssl_context
+
+from .const import (
+    DOMAIN,
+    HTTP_POOL_LIMIT,
+    HTTP_POOL_LIMIT_PER_HOST,
+    HTTP_KEEPALIVE_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class JellyfinClient:
+    """One pooled aiohttp session shared by every Jellyfin config entry.
+
+    Connections are kept alive between polls, so servers polled every few
+    seconds reuse their sockets (and TLS sessions) instead of reconnecting.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self.users = 0
+        self._ssl_contexts = {}  # (verify, host) -> ssl.SSLContext
+
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_POOL_LIMIT,
+            limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+        )
+        self.session = aiohttp.ClientSession(connector=connector)
+        self._unsub_close = hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, self._handle_close)
+
+    async def async_ssl_context(self, verify: bool, host: str):
+        """Return the SSL context for a host, building it (off the loop) only once."""
+        key = (verify, host)
+        context = self._ssl_contexts.get(key)
+        if context is None:
+            # Loading the CA bundle reads from disk
+            context = await self.hass.async_add_executor_job(
+                client_context if verify else create_no_verify_ssl_context
+            )
+            self._ssl_contexts[key] = context
+        return context
+
+    async def _handle_close(self, event):
+        self._unsub_close = None
+        await self.async_close()
+
+    async def async_close(self):
+        if self._unsub_close:
+            self._unsub_close()
+            self._unsub_close = None
+        self._ssl_contexts.clear()
+        if not self.session.closed:
+            await self.session.close()
+            _LOGGER.info("Jellyfin HTTP client closed")
+
+
+@callback
+def async_get_client(hass: HomeAssistant) -> JellyfinClient:
+    """Return the shared client and count one more user of it."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    client = domain_data.get("client")
+    if client is None or client.session.closed:
+        client = domain_data["client"] = JellyfinClient(hass)
+    client.users += 1
+    return client
+
+
+async def async_release_client(hass: HomeAssistant) -> None:
+    """Drop one user of the shared client, closing it after the last one."""
+    domain_data = hass.data.get(DOMAIN, {})
+    client = domain_data.get("client")
+    if client is None:
+        return
+    client.users -= 1
+    if client.users <= 0:
+        domain_data.pop("client")
+        await client.async_close()
@@ -3,9 +3,10 @@ from homeassistant.exceptions import HomeAssistantError
 import voluptuous as vol
 import logging
 
-from .const import DOMAIN
+from .const import DOMAIN, DEFAULT_PLAYBACK_FORMAT
 from .coordinator import JellyfinCoordinator
 from .options_flow import JellyfinOptionsFlowHandler
+from .template import compile_template, InvalidTemplateError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -15,6 +16,7 @@ class JellyfinConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_user(self, user_input=None):
         errors = {}
+        placeholders = {"placeholder": ""}
 
         # Use prior input values to repopulate the form on error
         default_name = user_input.get("server_name") if user_input else ""
@@ -34,6 +36,16 @@ class JellyfinConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     errors["base"] = "duplicate_server_name"
                     break
 
+            # Reject unknown placeholders before testing the connection
+            if not errors:
+                try:
+                    playback_format = user_input.get("playback_format", "").strip()
+                    if playback_format:
+                        compile_template(playback_format)
+                except InvalidTemplateError as err:
+                    errors["playback_format"] = "invalid_playback_format"
+                    placeholders["placeholder"] = err.placeholder
+
             # Skip Jellyfin validation if error already triggered
             if not errors:
                 try:
@@ -49,8 +61,10 @@ class JellyfinConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                             use_https=default_https,
                             ignore_ssl=default_ignore_ssl
                         )
-                        await temp_coordinator._async_update_data()
-                        await temp_coordinator.async_close()
+                        try:
+                            await temp_coordinator._async_update_data()
+                        finally:
+                            await temp_coordinator.async_close()
 
                         return self.async_create_entry(
                             title=default_name,
@@ -74,7 +88,7 @@ class JellyfinConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             vol.Required("port", default=default_port): int,
             vol.Required("api_key", default=default_api_key): str,
             vol.Required("scan_interval", default=default_scan): vol.In([0, 1, 5, 10, 15, 30, 60, 120]),
-            vol.Optional("playback_format", default="{play_icon} {media_icon} {user}: {artist} – {title} ({playing_position}/{playback_runtime}) {playback_percentage}"): str,
+            vol.Optional("playback_format", default=user_input.get("playback_format", DEFAULT_PLAYBACK_FORMAT) if user_input else DEFAULT_PLAYBACK_FORMAT): str,
             vol.Optional("idle_message", default="💤 Nothing Playing."): str,
             vol.Optional("use_https", default=default_https): bool,
             vol.Optional("ignore_ssl", default=default_ignore_ssl): bool
@@ -83,7 +97,8 @@ class JellyfinConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="user",
             data_schema=data_schema,
-            errors=errors
+            errors=errors,
+            description_placeholders=placeholders
         )
 
     @staticmethod
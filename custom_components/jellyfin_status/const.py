@@ -1 +1,113 @@
 DOMAIN = "jellyfin_status"
+
+# Endpoints polled by the coordinator, each on its own cadence
+ENDPOINT_SESSIONS = "sessions"
+ENDPOINT_COUNTS = "counts"
+ENDPOINT_LIBRARIES = "libraries"
+
+ENDPOINT_PATHS = {
+    ENDPOINT_SESSIONS: "/Sessions",
+    ENDPOINT_COUNTS: "/Items/Counts",
+    ENDPOINT_LIBRARIES: "/Library/VirtualFolders",
+}
+
+# Server-side filters sent with each request; /Sessions only returns clients
+# seen within the last 16 minutes, like the Jellyfin dashboard
+ENDPOINT_PARAMS = {
+    ENDPOINT_SESSIONS: {"ActiveWithinSeconds": 960},
+}
+
+# Per-request timeouts in seconds (/Items/Counts is a heavy query on large libraries)
+ENDPOINT_TIMEOUTS = {
+    ENDPOINT_SESSIONS: 10,
+    ENDPOINT_COUNTS: 30,
+    ENDPOINT_LIBRARIES: 30,
+}
+
+# A failing or timed-out endpoint other than /Sessions is retried after this many seconds,
+# doubling per failure up to the maximum, instead of on every sessions tick
+ENDPOINT_RETRY_MIN = 60
+ENDPOINT_RETRY_MAX = 1800
+
+# Library counts refresh cadence in minutes, 0 = only on first load and manual refresh
+DEFAULT_COUNTS_INTERVAL = 15
+COUNTS_INTERVAL_OPTIONS = [0, 1, 5, 15, 30, 60, 360, 1440]
+
+# Per-library statistics are refetched when /Items/Counts changes, on a LibraryChanged
+# push, or otherwise after this many seconds; "recently added" looks back this many days
+LIBRARY_STATS_TTL = 6 * 3600
+LIBRARY_RECENT_DAYS = 7
+LIBRARY_RECENT_LIMIT = 100  # Newest items read per library; recently_added stops counting here
+LIBRARY_PAGE_CONCURRENCY = 2  # Library /Items pages in flight at once, so the other endpoints keep a connection
+
+# WebSocket push mode
+WS_SESSIONS_INTERVAL_MS = 1500
+WS_RECONNECT_MIN = 5
+WS_RECONNECT_MAX = 300
+
+# Derived per-item metadata kept between polls
+ITEM_CACHE_SIZE = 256
+
+DEFAULT_PLAYBACK_FORMAT = "{play_icon} {media_icon} {user}: {artist} – {title} ({playing_position}/{playback_runtime}) {playback_percentage}"
+
+# Registry changes to this integration's entities are merged into one refresh per window (seconds)
+DEFAULT_REGISTRY_REFRESH_WINDOW = 10
+REGISTRY_REFRESH_WINDOW_OPTIONS = [1, 5, 10, 30, 60]
+
+# Minimum seconds between writes when only playback positions moved, 0 = write every change
+DEFAULT_POSITION_WRITE_INTERVAL = 0
+POSITION_WRITE_INTERVAL_OPTIONS = [0, 10, 30, 60, 300]
+
+# Seconds between locally interpolated position updates for playing sessions, 0 = only on polls
+DEFAULT_POSITION_UPDATE_INTERVAL = 0
+POSITION_UPDATE_INTERVAL_OPTIONS = [0, 1, 2, 5, 10]
+
+# Numeric per-server sensors recorded as long-term statistics; the shared translation key
+# is also how the registry index tells them apart from the server status sensors
+STATISTICS_TRANSLATION_KEY = "jellyfin_statistic_sensor"
+
+# Adaptive polling: scan_interval while sessions are active, doubling per idle poll
+# up to ADAPTIVE_IDLE_MAX, and exponential backoff with jitter after failures (seconds)
+ADAPTIVE_IDLE_MAX = 300
+ADAPTIVE_BACKOFF_MAX = 600
+ADAPTIVE_JITTER = 0.2
+
+# Shared HTTP client: connection pool limits and idle keep-alive (seconds)
+HTTP_POOL_LIMIT = 32
+HTTP_POOL_LIMIT_PER_HOST = 8  # The push WebSocket keeps one of these for as long as it is connected
+HTTP_KEEPALIVE_TIMEOUT = 75
+
+# Most polls fetching at once across all entries
+MAX_CONCURRENT_POLLS = 4
+
+# Response bodies larger than this (bytes) are decoded in the executor
+JSON_EXECUTOR_THRESHOLD = 256 * 1024
+
+# Samples kept per metric for the rolling percentiles in diagnostics
+METRICS_WINDOW = 100
+
+# debug_payloads: keep a sample of raw payloads in memory for the dump_payloads service
+CAPTURE_SIZE = 20
+CAPTURE_SAMPLE_EVERY = 10  # Capture one in this many payloads per endpoint
+CAPTURE_MAX_BYTES = 8 * 1024 * 1024
+
+# Last good snapshot per entry, restored at startup before the first poll
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 60  # Seconds; saves are batched at most once per delay
+
+# Circuit breaker: open after this many sessions failures in a row (fewer for auth failures),
+# then probe on a schedule that starts per failure kind and doubles up to BREAKER_PROBE_MAX (seconds)
+BREAKER_THRESHOLD = 3
+BREAKER_AUTH_THRESHOLD = 2  # Rejected API keys in a row; a single stray 401 doesn't stall polling
+BREAKER_PROBE_DELAYS = {"connect": 10, "timeout": 30, "auth": 60, "error": 15}
+BREAKER_PROBE_MAX = 600
+BREAKER_PROBE_TIMEOUT = 5
+PROBE_PATH = "/System/Info/Public"  # Cheap and unauthenticated
+
+# Session lifecycle events, fired on the bus from the difference between consecutive snapshots
+EVENT_PLAYBACK_STARTED = f"{DOMAIN}_playback_started"
+EVENT_PLAYBACK_STOPPED = f"{DOMAIN}_playback_stopped"
+EVENT_PLAYBACK_PAUSED = f"{DOMAIN}_playback_paused"
+EVENT_PLAYBACK_RESUMED = f"{DOMAIN}_playback_resumed"
+EVENT_ITEM_CHANGED = f"{DOMAIN}_item_changed"
+EVENT_TRANSCODE_STARTED = f"{DOMAIN}_transcode_started"
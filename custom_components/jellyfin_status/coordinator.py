@@ -1,26 +1,109 @@
-import aiohttp
 import async_timeout
+import asyncio
 import logging
-from datetime import datetime
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.json import json_loads
+
+from .const import (
+    DOMAIN,
+    STORAGE_VERSION,
+    STORAGE_SAVE_DELAY,
+    BREAKER_PROBE_TIMEOUT,
+    PROBE_PATH,
+    ENDPOINT_SESSIONS,
+    ENDPOINT_COUNTS,
+    ENDPOINT_LIBRARIES,
+    ENDPOINT_PATHS,
+    ENDPOINT_PARAMS,
+    ENDPOINT_TIMEOUTS,
+    ENDPOINT_RETRY_MIN,
+    ENDPOINT_RETRY_MAX,
+    JSON_EXECUTOR_THRESHOLD,
+    ADAPTIVE_IDLE_MAX,
+    ADAPTIVE_BACKOFF_MAX,
+    ADAPTIVE_JITTER,
+    LIBRARY_STATS_TTL,
+    LIBRARY_RECENT_DAYS,
+    LIBRARY_RECENT_LIMIT,
+    LIBRARY_PAGE_CONCURRENCY,
+)
+from .client import async_get_client, async_release_client
+from .scheduler import async_get_scheduler
+from .metadata import ItemMetadataCache
+from .models import JellyfinItem, JellyfinLibrary, JellyfinSession
+from .metrics import JellyfinMetrics
+from .capture import PayloadCapture
+from .breaker import CircuitBreaker, FAILURE_AUTH, STATE_HALF_OPEN, STATE_OPEN, describe_error
+from .events import diff_sessions
 
 _LOGGER = logging.getLogger(__name__)
 
 class JellyfinCoordinator(DataUpdateCoordinator):
     """Handles polling and session data retrieval for Jellyfin Status."""
 
-    def __init__(self, hass, entry, api_key, address, update_interval, use_https=False, ignore_ssl=False):
+    def __init__(self, hass, entry, api_key, address, update_interval, use_https=False, ignore_ssl=False, counts_interval=None, adaptive_polling=False, library_stats=False):
         self.api_key = api_key
         self.address = address  # Format: "host:port"
         self.use_https = use_https
         self.ignore_ssl = ignore_ssl
         self.last_updated = None
+        self.data_revision = 0  # Bumped whenever sessions or counts change; keys sensor caches
         self.library_counts = {}  # Initialize empty dictionary
+        self.counts_received = False  # /Items/Counts answered at least once (or was restored)
+        self.libraries = None  # list[JellyfinLibrary] once fetched, when library_stats is on
+        self._libraries_incomplete = False  # Some folder's page failed in the last fetch
         self.application_version = None
-        self.debug_payloads = entry.options.get("debug_payloads", False) if entry else False
+        self.sessions_received = None  # Monotonic time of the last live sessions snapshot
+        # debug_payloads samples raw payloads into a ring buffer instead of logging them
+        self.capture = PayloadCapture() if entry and entry.options.get("debug_payloads", False) else None
+
+        # Per-endpoint cadence in seconds: 0 = every tick, None = only when requested
+        self._endpoint_intervals = {
+            ENDPOINT_SESSIONS: 0,
+            ENDPOINT_COUNTS: counts_interval.total_seconds() if counts_interval else None,
+        }
+        if library_stats:
+            self._endpoint_intervals[ENDPOINT_LIBRARIES] = LIBRARY_STATS_TTL
+        self._endpoint_fetched = {}  # endpoint -> monotonic time of last successful fetch
+        self._endpoint_retry = {}  # endpoint -> (monotonic time of next attempt, failures in a row)
+        self._forced_endpoints = set()
+        self.push_active = False  # True while the WebSocket session feed is connected
+        self.websocket = None
+        # Parsed items are reused across polls while the same item keeps playing
+        self.item_cache = ItemMetadataCache(build=JellyfinItem.from_payload)
+        self.metrics = JellyfinMetrics()
+        self.breaker = CircuitBreaker(f"Jellyfin {address}")
+        # Last live snapshot by session Id, diffed into lifecycle events (None until the first one)
+        self._event_sessions = None
+
+        # Warm start: the last good snapshot is stored per entry
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}") if entry else None
+        self._save_requested = None
+
+        # poll_interval is the period between polls (adaptive polling moves it around
+        # the configured one); update_interval is the delay to this entry's next slot
+        self.nominal_interval = update_interval
+        self.poll_interval = update_interval
+        self.adaptive_polling = adaptive_polling and update_interval is not None
+        self._idle_seconds = update_interval.total_seconds() if update_interval else None
+        self._failures = 0
 
-        connector = aiohttp.TCPConnector(verify_ssl=not ignore_ssl)
-        self.session = aiohttp.ClientSession(connector=connector)
+        # Pooled session shared with the other entries; released in async_close
+        self.client = async_get_client(hass)
+        self.session = self.client.session
+
+        # Staggered against the other entries, with a shared cap on concurrent polls
+        self.entry_id = entry.entry_id if entry else None
+        self.scheduler = async_get_scheduler(hass)
+        if self.entry_id:
+            self.scheduler.register(self.entry_id)
+        self.last_poll_duration = None
+        self.last_poll_wait = None
 
         super().__init__(
             hass,
@@ -33,45 +116,420 @@ class JellyfinCoordinator(DataUpdateCoordinator):
         # Log polling activation at startup
         _LOGGER.info("JellyfinCoordinator initialized — polling every %s", update_interval)
 
-    async def _async_update_data(self):
-        """Fetches active Jellyfin sessions via REST API."""
+    @property
+    def base_url(self) -> str:
         protocol = "https" if self.use_https else "http"
-        base_url = f"{protocol}://{self.address}"
-        sessions_url = f"{base_url}/Sessions?api_key={self.api_key}"
-        counts_url = f"{base_url}/Items/Counts?api_key={self.api_key}"
+        return f"{protocol}://{self.address}"
+
+    async def async_ssl_context(self):
+        """SSL context for this server, honouring ignore_ssl."""
+        return await self.client.async_ssl_context(not self.ignore_ssl, self.address.rsplit(":", 1)[0])
+
+    def request_endpoints(self, *endpoints):
+        """Force the given endpoints (default: all) to be fetched on the next refresh."""
+        self._forced_endpoints.update(endpoints or self._endpoint_intervals)
+
+    def _due_endpoints(self, now: float) -> list[str]:
+        """Return the endpoints whose cadence has elapsed (or were never fetched)."""
+        due = []
+        for endpoint, interval in self._endpoint_intervals.items():
+            if endpoint == ENDPOINT_SESSIONS and self.push_active:
+                continue  # Sessions arrive over the WebSocket instead
+            if endpoint in self._forced_endpoints:
+                due.append(endpoint)
+                continue
+            retry = self._endpoint_retry.get(endpoint)
+            if retry is not None:
+                # Failing: wait out the backoff, whatever the normal cadence says
+                if now >= retry[0]:
+                    due.append(endpoint)
+                continue
+            last = self._endpoint_fetched.get(endpoint)
+            if last is None or (interval is not None and now - last >= interval):
+                due.append(endpoint)
+        return due
+
+    def _record_attempt(self, endpoint: str, now: float, failed: bool) -> None:
+        """Note a finished fetch; failures push the endpoint's next attempt back."""
+        self._forced_endpoints.discard(endpoint)
+        if not failed:
+            self._endpoint_fetched[endpoint] = now
+            self._endpoint_retry.pop(endpoint, None)
+        elif endpoint != ENDPOINT_SESSIONS:  # Sessions failures are handled by the breaker
+            failures = self._endpoint_retry.get(endpoint, (None, 0))[1] + 1
+            delay = min(ENDPOINT_RETRY_MIN * 2 ** (failures - 1), ENDPOINT_RETRY_MAX)
+            self._endpoint_retry[endpoint] = (now + delay, failures)
+
+    def set_push_active(self, active: bool) -> None:
+        """Switch sessions between WebSocket push and REST polling."""
+        if active == self.push_active:
+            return
+        self.push_active = active
+        _LOGGER.info("📡 Jellyfin session push %s", "connected" if active else "lost — falling back to polling")
+        if not active:
+            # Don't wait for the next tick to get sessions back over REST
+            self.hass.async_create_task(self.async_request_refresh())
+
+    def async_set_sessions(self, session_data: list) -> None:
+        """Push a Sessions payload received over the WebSocket to listeners."""
+        self.last_updated = datetime.now().isoformat()
+        self.data_revision += 1
+        # A pushed snapshot proves the server is reachable; drop the probe delay from the timer
+        if not self.breaker.closed:
+            self.breaker.record_success()
+            self._schedule_next_poll()
+        self.async_set_updated_data(self._handle_sessions(session_data))
+        self._schedule_save()
+
+        # Pushes reschedule the poll timer, so slower endpoints are checked here
+        if self._due_endpoints(time.monotonic()):
+            self.hass.async_create_task(self.async_request_refresh())
+
+    def _handle_sessions(self, session_data: list) -> list[JellyfinSession]:
+        # Parsed once here; only the fields the sensors read are kept between polls
+        sessions = [JellyfinSession.from_payload(s, self.item_cache) for s in session_data]
+        self.sessions_received = time.monotonic()
+
+        # Capture server version (Keep previous version if current list is empty)
+        self.application_version = next(
+            (s.application_version for s in sessions if s.application_version),
+            self.application_version
+        )
+        self._fire_session_events(sessions)
+        return sessions
+
+    def _fire_session_events(self, sessions: list[JellyfinSession]) -> None:
+        """Fire lifecycle events against the previous live snapshot.
+
+        The first snapshot after startup only sets the baseline, so playback
+        already in progress (or restored from storage) is not reported as new.
+        """
+        if self.entry_id is None:
+            return
+        previous = self._event_sessions
+        self._event_sessions = {session.id: session for session in sessions}
+        if previous is None:
+            return
+
+        for event_type, data in diff_sessions(previous, sessions):
+            data["entry_id"] = self.entry_id
+            data["server"] = self.address
+            _LOGGER.debug("📣 %s: %s", event_type, data)
+            self.hass.bus.async_fire(event_type, data)
+
+    async def _fetch_endpoint(self, endpoint: str, path: str = None, params: dict = None):
+        """Fetch a single endpoint (or another path counted under it) under its own timeout."""
+        url = f"{self.base_url}{path or ENDPOINT_PATHS[endpoint]}?api_key={self.api_key}"
+        if params is None:
+            params = ENDPOINT_PARAMS.get(endpoint)
+        ssl_context = await self.async_ssl_context()
+        metrics = self.metrics.endpoint(endpoint)
+        started = time.monotonic()
+        async with async_timeout.timeout(ENDPOINT_TIMEOUTS[endpoint]):
+            async with self.session.get(url, params=params, ssl=ssl_context) as resp:
+                resp.raise_for_status()
+                body = await resp.read()
+        received = time.monotonic()
+        payload = await self.async_decode_json(body)
+
+        latency_ms = (received - started) * 1000
+        decode_ms = (time.monotonic() - received) * 1000
+        metrics.latency_ms.add(latency_ms)
+        metrics.response_bytes.add(len(body))
+        metrics.decode_ms.add(decode_ms)
+        if self.capture is not None:
+            self.capture.add(endpoint, body, latency_ms, decode_ms)
+        return payload
+
+    async def _fetch_libraries(self) -> list[JellyfinLibrary]:
+        """Media folders plus one /Items page each: the total and the newest items.
+
+        A folder whose page fails keeps its previous statistics (or is left
+        out until it answers), and the fetch is retried on the failure backoff.
+        Only a few pages run at once: each one's timeout starts when it gets
+        its turn, not while it waits behind the other folders for a connection.
+        """
+        folders = await self._fetch_endpoint(ENDPOINT_LIBRARIES)
+        folders = [folder for folder in folders if folder.get("ItemId")]
+        since = datetime.now(timezone.utc) - timedelta(days=LIBRARY_RECENT_DAYS)
+        semaphore = asyncio.Semaphore(LIBRARY_PAGE_CONCURRENCY)
+
+        async def fetch_page(folder):
+            async with semaphore:
+                return await self._fetch_endpoint(ENDPOINT_LIBRARIES, "/Items", {
+                    "ParentId": folder["ItemId"],
+                    "Recursive": "true",
+                    "IsFolder": "false",
+                    "SortBy": "DateCreated",
+                    "SortOrder": "Descending",
+                    "Limit": LIBRARY_RECENT_LIMIT,
+                    "Fields": "DateCreated",
+                    "EnableImages": "false",
+                    "EnableUserData": "false",
+                })
+
+        pages = await asyncio.gather(*(fetch_page(folder) for folder in folders), return_exceptions=True)
+
+        previous = {library.id: library for library in self.libraries or []}
+        libraries = []
+        failed = 0
+        for folder, page in zip(folders, pages):
+            if isinstance(page, asyncio.CancelledError):
+                raise page
+            if isinstance(page, Exception):
+                failed += 1
+                self.metrics.record_error(ENDPOINT_LIBRARIES, page)
+                _LOGGER.warning("📚 Jellyfin library '%s' statistics failed: %s", folder.get("Name"), describe_error(page))
+                if folder["ItemId"] in previous:
+                    libraries.append(previous[folder["ItemId"]])
+                continue
+            libraries.append(JellyfinLibrary.from_payload(folder, page, since))
+        self._libraries_incomplete = failed > 0
+        return libraries
+
+    @callback
+    def async_library_changed(self) -> None:
+        """Jellyfin reported a library change: refetch counts (and library stats) soon."""
+        _LOGGER.debug("📚 Jellyfin library changed, refreshing library data")
+        self.request_endpoints(*(e for e in (ENDPOINT_COUNTS, ENDPOINT_LIBRARIES) if e in self._endpoint_intervals))
+        self.hass.async_create_task(self.async_request_refresh())
 
-        _LOGGER.debug("Polling Jellyfin sessions and counts (SSL verify: %s)", not self.ignore_ssl)
+    async def async_decode_json(self, body):
+        """Decode a JSON payload, in the executor when it is large enough to stall the loop."""
+        if len(body) > JSON_EXECUTOR_THRESHOLD:
+            return await self.hass.async_add_executor_job(json_loads, body)
+        return json_loads(body)
 
+    @property
+    def poll_offset(self) -> float:
+        """Seconds into each poll period at which this entry polls."""
+        if self.poll_interval is None or not self.entry_id:
+            return 0.0
+        return self.scheduler.offset(self.entry_id, self.poll_interval.total_seconds())
+
+    async def _async_update_data(self):
         try:
-            async with async_timeout.timeout(10):
-                # Fetch Active Sessions
-                async with self.session.get(sessions_url) as resp:
-                    session_data = await resp.json()
-                
-                # Fetch Library Counts
-                async with self.session.get(counts_url) as resp:
-                    self.library_counts = await resp.json()
-
-                # Update timestamp
-                self.last_updated = datetime.now().isoformat()
-                
-                if self.debug_payloads: 
-                    _LOGGER.debug("Session payload → %s", session_data)
-                    _LOGGER.debug("Counts payload → %s", self.library_counts)
-
-                # Capture server version (Keep previous version if current list is empty)
-                self.application_version = next(
-                    (s.get("ApplicationVersion") for s in session_data if s.get("ApplicationVersion")),
-                    self.application_version
-                )
-
-                return session_data
+            return await self._async_poll()
+        finally:
+            self._schedule_next_poll()
+
+    def _schedule_next_poll(self) -> None:
+        """Aim the next poll at this entry's slot (retries after a failure keep their jitter)."""
+        if self.poll_interval is None:
+            return
+        period = self.poll_interval.total_seconds()
+        delay = period
+        if not self.breaker.closed:
+            # Nothing is requested until the next probe, so wake up for that
+            delay = max(self.breaker.seconds_to_probe(time.monotonic()) or period, 1)
+        elif self.entry_id and not self._failures:
+            delay = self.scheduler.delay(self.entry_id, period, self.hass.loop.time())
+        self.update_interval = timedelta(seconds=delay)
+
+    async def _async_poll(self):
+        """Fetches the due Jellyfin endpoints concurrently via REST API."""
+        now = time.monotonic()
+        due = self._due_endpoints(now)
+        if not due:
+            return self.data
+
+        if not self.breaker.closed:
+            await self._async_probe(now)
+
+        _LOGGER.debug("Polling Jellyfin endpoints %s (SSL verify: %s)", due, not self.ignore_ssl)
+
+        async with self.scheduler.semaphore:
+            started = time.monotonic()
+            results = await asyncio.gather(
+                *(
+                    self._fetch_libraries() if endpoint == ENDPOINT_LIBRARIES else self._fetch_endpoint(endpoint)
+                    for endpoint in due
+                ),
+                return_exceptions=True
+            )
+        self.last_poll_wait = started - now
+        self.last_poll_duration = time.monotonic() - started
+
+        payloads = {}
+        errors = {}
+        for endpoint, result in zip(due, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            failed = isinstance(result, Exception)
+            # A partial library fetch is used, but retried like a failure
+            incomplete = endpoint == ENDPOINT_LIBRARIES and not failed and self._libraries_incomplete
+            self._record_attempt(endpoint, now, failed or incomplete)
+            if failed:
+                errors[endpoint] = result
+            else:
+                payloads[endpoint] = result
+
+        # Keep whatever arrived, even if another endpoint failed in the same tick
+        if ENDPOINT_COUNTS in payloads:
+            counts = payloads[ENDPOINT_COUNTS]
+            # Counts are the cheap change check for the per-library statistics
+            if (
+                ENDPOINT_LIBRARIES in self._endpoint_intervals
+                and ENDPOINT_LIBRARIES not in payloads
+                and self.library_counts
+                and counts != self.library_counts
+            ):
+                self._forced_endpoints.add(ENDPOINT_LIBRARIES)
+            self.library_counts = counts
+            self.counts_received = True
+        if ENDPOINT_LIBRARIES in payloads:
+            self.libraries = payloads[ENDPOINT_LIBRARIES]
+
+        if payloads:
+            # Update timestamp
+            self.last_updated = datetime.now().isoformat()
+            self.data_revision += 1
+            self._schedule_save()
+
+        for endpoint, err in errors.items():
+            self.metrics.record_error(endpoint, err)
+            if endpoint != ENDPOINT_SESSIONS:
+                _LOGGER.warning("Jellyfin %s update failed, keeping previous data: %s", endpoint, describe_error(err))
+
+        if ENDPOINT_SESSIONS in errors:
+            err = errors[ENDPOINT_SESSIONS]
+            kind = self.breaker.record_failure(err)
+            # One error per outage; the breaker logs when it opens and recovers
+            if self.breaker.failures == 1:
+                if kind == FAILURE_AUTH:
+                    _LOGGER.error("🔑 Jellyfin rejected the API key: %s", describe_error(err))
+                else:
+                    _LOGGER.error("Jellyfin update failed: %s", describe_error(err))
+            else:
+                _LOGGER.debug("Jellyfin update failed again (%s): %s", kind, describe_error(err))
+            self._adapt_interval(None)
+            raise UpdateFailed(f"Error communicating with Jellyfin: {describe_error(err)}")
+
+        if payloads:
+            self.breaker.record_success()
+        elif self.breaker.state == STATE_HALF_OPEN:
+            # Auth probe by regular poll, and only other endpoints were due: they decide
+            err = next(iter(errors.values()))
+            self.breaker.record_failure(err)
+            raise UpdateFailed(f"Error communicating with Jellyfin: {describe_error(err)}")
 
+        if ENDPOINT_SESSIONS not in payloads:
+            return self.data or []
+
+        sessions = self._handle_sessions(payloads[ENDPOINT_SESSIONS])
+        self._adapt_interval(sessions)
+        return sessions
+
+    async def _async_probe(self, now: float) -> None:
+        """While the breaker is open, skip requests until a probe is due, then run one.
+
+        Auth failures are probed by the regular poll, since the cheap probe
+        endpoint does not need an API key; other kinds probe PROBE_PATH first
+        and close the breaker when it answers. A breaker left half open (a
+        probe that was cancelled, or a poll without a verdict) probes again.
+        """
+        if self.breaker.state == STATE_OPEN and not self.breaker.probe_due(now):
+            raise UpdateFailed(
+                f"Jellyfin unavailable ({self.breaker.failure_kind}), "
+                f"next probe in {int(self.breaker.seconds_to_probe(now))}s"
+            )
+        self.breaker.start_probe()
+        if self.breaker.failure_kind == FAILURE_AUTH:
+            return
+
+        try:
+            ssl_context = await self.async_ssl_context()
+            async with async_timeout.timeout(BREAKER_PROBE_TIMEOUT):
+                async with self.session.get(f"{self.base_url}{PROBE_PATH}", ssl=ssl_context) as resp:
+                    resp.raise_for_status()
+        except asyncio.CancelledError:
+            raise
         except Exception as err:
-            _LOGGER.error("Jellyfin update failed: %s", err)
-            raise UpdateFailed(f"Error communicating with Jellyfin: {err}")
+            self.breaker.record_failure(err)
+            raise UpdateFailed(f"Jellyfin probe failed: {describe_error(err)}") from err
+        self.breaker.record_success()
+
+    def _adapt_interval(self, sessions) -> None:
+        """Pick the next poll interval in adaptive mode (sessions=None after a failure)."""
+        if not self.adaptive_polling:
+            return
+
+        base = self.nominal_interval.total_seconds()
+        if sessions is None:
+            # Exponential backoff, jittered so several servers don't retry in lockstep
+            self._failures += 1
+            # The exponent is clamped: a long outage must not overflow the float maths
+            seconds = min(base * 2 ** min(self._failures, 16), max(ADAPTIVE_BACKOFF_MAX, base))
+            seconds *= 1 + random.uniform(0, ADAPTIVE_JITTER)
+        else:
+            self._failures = 0
+            if any(session.item for session in sessions):
+                self._idle_seconds = base
+            else:
+                self._idle_seconds = min(self._idle_seconds * 2, max(ADAPTIVE_IDLE_MAX, base))
+            seconds = self._idle_seconds
+
+        if seconds != self.poll_interval.total_seconds():
+            _LOGGER.debug("⏱️ Adaptive polling: polling every %.1fs", seconds)
+            self.poll_interval = timedelta(seconds=seconds)
+            # Shown as current_polling_interval_seconds, so cached sensor state must be rebuilt
+            self.data_revision += 1
+
+    async def async_restore(self) -> bool:
+        """Load the last good snapshot, so entities start from it instead of waiting on the server."""
+        if self._store is None:
+            return False
+        stored = await self._store.async_load()
+        if not stored:
+            return False
+        try:
+            sessions = [JellyfinSession.from_dict(session) for session in stored.get("sessions", [])]
+        except (TypeError, KeyError) as err:
+            _LOGGER.warning("🗄️ Ignoring stored Jellyfin snapshot: %s", err)
+            return False
+
+        self.library_counts = stored.get("library_counts") or {}
+        self.counts_received = bool(self.library_counts)
+        self.application_version = stored.get("application_version")
+        self.last_updated = stored.get("last_updated")
+        if self.library_counts and self._endpoint_intervals[ENDPOINT_COUNTS] is not None:
+            # Restored counts are good until their normal refresh is due
+            self._endpoint_fetched[ENDPOINT_COUNTS] = time.monotonic()
+        if stored.get("libraries") is not None and ENDPOINT_LIBRARIES in self._endpoint_intervals:
+            try:
+                self.libraries = [JellyfinLibrary.from_dict(library) for library in stored["libraries"]]
+            except (TypeError, KeyError):
+                self.libraries = None
+            else:
+                self._endpoint_fetched[ENDPOINT_LIBRARIES] = time.monotonic()
+        self.data = sessions
+        self.data_revision += 1
+        _LOGGER.info("🗄️ Restored Jellyfin snapshot from %s", self.last_updated)
+        return True
+
+    def _schedule_save(self) -> None:
+        # Each call would push the delayed write back, so only ask once per delay
+        if self._store is None:
+            return
+        now = time.monotonic()
+        if self._save_requested is None or now - self._save_requested >= STORAGE_SAVE_DELAY:
+            self._save_requested = now
+            self._store.async_delay_save(self._stored_data, STORAGE_SAVE_DELAY)
+
+    def _stored_data(self) -> dict:
+        return {
+            "last_updated": self.last_updated,
+            "application_version": self.application_version,
+            "library_counts": self.library_counts,
+            "libraries": [library.as_dict() for library in self.libraries] if self.libraries is not None else None,
+            "sessions": [session.as_dict() for session in self.data or []],
+        }
 
     async def async_close(self):
-        """Closes HTTP session on unload."""
-        await self.session.close()
-        _LOGGER.info("JellyfinCoordinator session closed")
+        """Releases the shared HTTP client on unload."""
+        if self.entry_id:
+            self.scheduler.unregister(self.entry_id)
+        if self.client is not None:
+            self.client = None
+            await async_release_client(self.hass)
+            _LOGGER.info("JellyfinCoordinator released HTTP client")
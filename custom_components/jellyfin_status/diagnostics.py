@@ -0,0 +1,50 @@
+import re
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+TO_REDACT = {"api_key"}
+# Error texts are kept, but any api_key query value in them is masked
+_API_KEY_PARAM = re.compile(r"(api_key=)[^&\s'\"]+", re.IGNORECASE)
+
+
+def _redact_error(text, api_key):
+    if not text:
+        return text
+    text = _API_KEY_PARAM.sub(r"\1**REDACTED**", text)
+    return text.replace(api_key, "**REDACTED**") if api_key else text
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict:
+    """Return diagnostics for a config entry, including its performance metrics."""
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    diagnostics = {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+    }
+    if coordinator is None:
+        return diagnostics
+
+    diagnostics["coordinator"] = {
+        "last_update_success": coordinator.last_update_success,
+        "last_updated": coordinator.last_updated,
+        "server_version": coordinator.application_version,
+        "poll_interval_seconds": coordinator.poll_interval.total_seconds() if coordinator.poll_interval else None,
+        "poll_offset_seconds": round(coordinator.poll_offset, 1),
+        "push_active": coordinator.push_active,
+        "data_revision": coordinator.data_revision,
+        "session_count": len(coordinator.data or []),
+    }
+    diagnostics["breaker"] = coordinator.breaker.as_dict()
+    diagnostics["metrics"] = coordinator.metrics.as_dict()
+
+    api_key = coordinator.api_key
+    diagnostics["breaker"]["last_error"] = _redact_error(diagnostics["breaker"]["last_error"], api_key)
+    for endpoint in diagnostics["metrics"]["endpoints"].values():
+        endpoint["last_error"] = _redact_error(endpoint.get("last_error"), api_key)
+    return diagnostics
@@ -1,11 +1,104 @@
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity_registry import async_get as get_entity_registry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.entity_registry import (
+    EVENT_ENTITY_REGISTRY_UPDATED,
+    async_get as get_entity_registry,
+)
 
-async def get_jellyfin_sensor_entity_ids(hass: HomeAssistant) -> list[str]:
+from .const import DOMAIN, STATISTICS_TRANSLATION_KEY
+
+
+def _is_tracked(entry) -> bool:
+    return (
+        entry.domain == "sensor"
+        and entry.platform == DOMAIN
+        and not entry.disabled_by
+        and entry.entity_category != EntityCategory.DIAGNOSTIC
+        and entry.translation_key != STATISTICS_TRANSLATION_KEY
+    )
+
+
+class JellyfinEntityIndex:
+    """Entity IDs of this integration's sensors, kept current from registry events.
+
+    Built from one registry scan, then updated per create/update/remove
+    event so lookups never walk the whole entity registry again.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self._registry = get_entity_registry(hass)
+        self.entity_ids = {}  # entity_id -> config_entry_id, in registry order
+        self._listeners = []
+
+        for entry in self._registry.entities.values():
+            if _is_tracked(entry):
+                self.entity_ids[entry.entity_id] = entry.config_entry_id
+
+        self._unsub = hass.bus.async_listen(EVENT_ENTITY_REGISTRY_UPDATED, self._handle_registry_update)
+
+    @callback
+    def async_add_listener(self, update_callback):
+        """Call update_callback(config_entry_ids) whenever the set of entity IDs changes.
+
+        config_entry_ids holds the config entries whose entities were affected.
+        """
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener():
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _handle_registry_update(self, event):
+        action = event.data.get("action")
+        entity_id = event.data.get("entity_id")
+        affected = set()
+
+        def _discard(eid):
+            if eid in self.entity_ids:
+                affected.add(self.entity_ids.pop(eid))
+
+        if action == "remove":
+            _discard(entity_id)
+        elif action in ("create", "update"):
+            # Renames arrive as an update carrying the previous entity_id
+            old_entity_id = event.data.get("old_entity_id")
+            if old_entity_id:
+                _discard(old_entity_id)
+
+            entry = self._registry.async_get(entity_id)
+            if entry is not None and _is_tracked(entry):
+                if self.entity_ids.get(entity_id, False) != entry.config_entry_id:
+                    _discard(entity_id)
+                    self.entity_ids[entity_id] = entry.config_entry_id
+                    affected.add(entry.config_entry_id)
+            else:
+                _discard(entity_id)
+
+        if affected:
+            for update_callback in list(self._listeners):
+                update_callback(affected)
+
+    @callback
+    def async_close(self):
+        self._unsub()
+        self._listeners.clear()
+
+
+@callback
+def async_get_entity_index(hass: HomeAssistant) -> JellyfinEntityIndex:
+    """Return the shared entity index, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    index = domain_data.get("entity_index")
+    if index is None:
+        index = domain_data["entity_index"] = JellyfinEntityIndex(hass)
+    return index
+
+
+@callback
+def get_jellyfin_sensor_entity_ids(hass: HomeAssistant) -> list[str]:
     """Return all entity IDs for Jellyfin sensors, dynamically and safely."""
-    registry = get_entity_registry(hass)
-    return [
-        entry.entity_id
-        for entry in registry.entities.values()
-        if entry.domain == "sensor" and entry.platform == "jellyfin"
-    ]
+    return list(async_get_entity_index(hass).entity_ids)
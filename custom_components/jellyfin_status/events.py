@@ -0,0 +1,74 @@
+from .const import (
+    EVENT_PLAYBACK_STARTED,
+    EVENT_PLAYBACK_STOPPED,
+    EVENT_PLAYBACK_PAUSED,
+    EVENT_PLAYBACK_RESUMED,
+    EVENT_ITEM_CHANGED,
+    EVENT_TRANSCODE_STARTED,
+)
+from .models import JellyfinSession
+
+TRANSCODE = "Transcode"
+
+
+def _payload(session: JellyfinSession) -> dict:
+    """The compact event data: who, where and what, without stream details."""
+    item = session.item
+    return {
+        "session_id": session.id,
+        "user": session.user,
+        "device": session.device,
+        "client": session.client,
+        "item_id": item.id if item else None,
+        "item_name": item.name if item else None,
+        "item_type": item.type if item else None,
+        "series": item.series if item else None,
+        "position_ticks": session.position_ticks,
+        "play_method": session.play_method,
+    }
+
+
+def diff_sessions(previous: dict, sessions: list[JellyfinSession]) -> list[tuple[str, dict]]:
+    """Lifecycle events between two snapshots, matched by session Id in one pass.
+
+    previous maps session Id to the session from the last snapshot. Only
+    active sessions (an item playing or paused) count as playback, so a
+    client that stays connected after stopping reports a stop.
+    """
+    events = []
+    remaining = dict(previous)
+
+    for session in sessions:
+        before = remaining.pop(session.id, None)
+        was_active = before is not None and before.is_active
+        if not session.is_active:
+            if was_active:
+                events.append((EVENT_PLAYBACK_STOPPED, _payload(before)))
+            continue
+
+        transcoding = session.play_method == TRANSCODE
+        if not was_active:
+            events.append((EVENT_PLAYBACK_STARTED, _payload(session)))
+        elif before.item.id != session.item.id:
+            data = _payload(session)
+            data["previous_item_id"] = before.item.id
+            data["previous_item_name"] = before.item.name
+            events.append((EVENT_ITEM_CHANGED, data))
+        else:
+            if before.play_state != session.play_state:
+                event_type = EVENT_PLAYBACK_PAUSED if session.play_state == "Paused" else EVENT_PLAYBACK_RESUMED
+                events.append((event_type, _payload(session)))
+            # Same item and already transcoding: nothing new started
+            transcoding = transcoding and before.play_method != TRANSCODE
+
+        if transcoding:
+            data = _payload(session)
+            data["transcode_reasons"] = list(session.transcode_reasons)
+            events.append((EVENT_TRANSCODE_STARTED, data))
+
+    # Sessions that disappeared altogether
+    for before in remaining.values():
+        if before.is_active:
+            events.append((EVENT_PLAYBACK_STOPPED, _payload(before)))
+
+    return events
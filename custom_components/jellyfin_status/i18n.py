@@ -0,0 +1,110 @@
+import asyncio
+import json
+import logging
+import os
+
+import aiofiles
+import aiofiles.os
+
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+TRANSLATIONS_PATH = os.path.join(os.path.dirname(__file__), "translations")
+
+# Process-wide caches, shared by every sensor of every config entry
+_language = None
+_files = {}      # language -> parsed translation file
+_sections = {}   # translation_key -> entity.sensor.<key>.state_attributes
+_lock = asyncio.Lock()
+
+
+# Function to log available translation files
+async def async_log_translation_files():
+    try:
+        files = await aiofiles.os.listdir(TRANSLATIONS_PATH)
+        json_files = [f for f in files if f.endswith(".json")]
+        _LOGGER.debug("Available translation files in %s: %s", TRANSLATIONS_PATH, json_files)
+    except FileNotFoundError:
+        _LOGGER.debug("Translations directory not found at %s", TRANSLATIONS_PATH)
+    except Exception as e:
+        _LOGGER.error("Error listing translation files in %s: %s", TRANSLATIONS_PATH, e)
+
+
+async def async_get_attribute_translations(hass: HomeAssistant, translation_key: str) -> dict:
+    """Return the state_attributes translations for a sensor translation key.
+
+    Each language file is read and parsed at most once per process; the
+    cache is dropped when the Home Assistant language changes.
+    """
+    _async_track_language(hass)
+    language = hass.config.language.split("-")[0]
+
+    async with _lock:
+        if language != _language:
+            _async_reset(language)
+            await async_log_translation_files()
+
+        if translation_key not in _sections:
+            raw_json_data = _files.get(language)
+            if raw_json_data is None:
+                raw_json_data = _files[language] = await _async_load_file(language)
+
+            # Path: entity.sensor.<translation_key>.state_attributes
+            entity_path = raw_json_data.get("entity", {}).get("sensor", {}).get(translation_key, {})
+            if "state_attributes" not in entity_path:
+                _LOGGER.warning(
+                    "⚠️ No translations found under entity.sensor.%s.state_attributes for '%s'",
+                    translation_key, language
+                )
+            _sections[translation_key] = entity_path.get("state_attributes", {})
+            _LOGGER.debug("🌍 Loaded state_attributes translations for %s: %s", translation_key, _sections[translation_key])
+
+        return _sections[translation_key]
+
+
+async def _async_load_file(language: str) -> dict:
+    translation_file_path = os.path.join(TRANSLATIONS_PATH, f"{language}.json")
+
+    # Fallback to 'en.json' if the specific language file doesn't exist
+    if not await aiofiles.os.path.exists(translation_file_path):
+        _LOGGER.warning("🌐 Missing translation for '%s', falling back to English.", language)
+        translation_file_path = os.path.join(TRANSLATIONS_PATH, "en.json")
+
+    try:
+        async with aiofiles.open(translation_file_path, mode='r', encoding='utf-8') as f:
+            return json.loads(await f.read())
+    except FileNotFoundError:
+        _LOGGER.error("❌ Translation file not found at %s", translation_file_path)
+    except json.JSONDecodeError as e:
+        _LOGGER.error("🧨 JSON decode error from translation file %s: %s", translation_file_path, e)
+    except Exception as e:
+        _LOGGER.error("💥 Unexpected error during translation loading: %s", e)
+    return {}
+
+
+@callback
+def _async_reset(language: str) -> None:
+    global _language
+    _language = language
+    _files.clear()
+    _sections.clear()
+
+
+@callback
+def _async_track_language(hass: HomeAssistant) -> None:
+    """Drop the cache when the configured language changes (once per hass instance)."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if domain_data.get("translations_listener"):
+        return
+
+    @callback
+    def _handle_config_update(event):
+        if hass.config.language.split("-")[0] != _language:
+            _LOGGER.debug("🌐 Language changed to '%s', clearing translation cache", hass.config.language)
+            _async_reset(None)
+
+    domain_data["translations_listener"] = hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, _handle_config_update)
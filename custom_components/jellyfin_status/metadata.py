@@ -0,0 +1,104 @@
+import re
+from collections import OrderedDict
+
+from .const import ITEM_CACHE_SIZE
+
+CHANNEL_LABELS = {1: "Mono", 2: "Stereo", 6: "5.1", 8: "7.1"}
+
+_RATING_SPLIT = re.compile(r"[;/]")
+
+
+def clean_rating(raw_rating: str) -> str:
+    """Reduce OfficialRating values like 'US:PG-13 / Rated PG-13' to 'PG-13'."""
+    if not raw_rating:
+        return ""
+
+    # Split by '/' or ';' in case of duplicates and take the first one
+    rating = _RATING_SPLIT.split(raw_rating)[0].strip()
+
+    # Remove prefixes like "US:", "United States:", "Germany:FSK-", etc.
+    # This looks for a colon and takes everything after it
+    if ":" in rating:
+        rating = rating.split(":")[-1].strip()
+
+    # Final cleanup: remove the word "Rated" if it's still there
+    return rating.replace("Rated", "").strip()
+
+
+def audio_label(stream: dict) -> str:
+    """Codec and channel layout of an audio stream, e.g. 'AC3 5.1'."""
+    codec = stream.get("Codec", "").upper()
+    if not codec:
+        return ""
+    channels = stream.get("Channels")
+    channel_label = CHANNEL_LABELS.get(channels, f"{channels}ch") if channels else ""
+    return f"{codec} {channel_label}".strip()
+
+
+def video_quality(stream: dict) -> str:
+    """Resolution and dynamic range of a video stream, e.g. '4K HDR'."""
+    width = stream.get("Width", 0)
+    v_range = stream.get("VideoRange", "")
+
+    if width >= 3840: res = "4K"
+    elif width >= 1920: res = "1080p"
+    elif width >= 1280: res = "720p"
+    elif width >= 720: res = "480p"
+    else: res = f"{width}p" if width > 0 else ""
+
+    quality = f"{res} {v_range}" if "SDR" not in v_range and v_range else res
+    return quality.strip()
+
+
+def derive_item_metadata(item: dict) -> dict:
+    """Values that depend only on the media item, not on playback."""
+    audio_stream = {}
+    video_stream = {}
+    # Single pass over MediaStreams, keeping the first stream of each type
+    for stream in item.get("MediaStreams", []):
+        stream_type = stream.get("Type")
+        if stream_type == "Audio" and not audio_stream:
+            audio_stream = stream
+        elif stream_type == "Video" and not video_stream:
+            video_stream = stream
+        if audio_stream and video_stream:
+            break
+
+    return {
+        "official_rating": clean_rating(item.get("OfficialRating", "")),
+        "audio": audio_label(audio_stream),
+        "quality": video_quality(video_stream),
+        "artist": next(iter(item.get("Artists", [])), item.get("AlbumArtist", "Unknown")),
+        "series": item.get("SeriesName", "Unknown"),
+    }
+
+
+class ItemMetadataCache:
+    """Bounded LRU of values built from items, keyed by item Id and revision."""
+
+    def __init__(self, maxsize: int = ITEM_CACHE_SIZE, build=derive_item_metadata):
+        self.maxsize = maxsize
+        self._build = build
+        self._items = OrderedDict()  # item Id -> (revision, built value)
+
+    def get(self, item: dict):
+        item_id = item.get("Id")
+        if not item_id:
+            return self._build(item)
+
+        # DateLastSaved / Etag change when the item is edited or rescanned
+        revision = item.get("DateLastSaved") or item.get("Etag")
+        cached = self._items.get(item_id)
+        if cached is not None and cached[0] == revision:
+            self._items.move_to_end(item_id)
+            return cached[1]
+
+        metadata = self._build(item)
+        self._items[item_id] = (revision, metadata)
+        self._items.move_to_end(item_id)
+        if len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+        return metadata
+
+    def clear(self) -> None:
+        self._items.clear()
@@ -0,0 +1,87 @@
+from collections import deque
+
+from .breaker import describe_error
+from .const import METRICS_WINDOW
+
+
+class RollingStats:
+    """The most recent samples of one measurement, for rolling percentiles."""
+
+    def __init__(self, maxlen: int = METRICS_WINDOW):
+        self._samples = deque(maxlen=maxlen)
+        self.count = 0  # All samples ever added, not just the window
+
+    def add(self, value: float) -> None:
+        self._samples.append(value)
+        self.count += 1
+
+    @property
+    def last(self):
+        return self._samples[-1] if self._samples else None
+
+    def percentile(self, percent: float):
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1)))]
+
+    def as_dict(self) -> dict:
+        def _round(value):
+            return round(value, 2) if value is not None else None
+
+        return {
+            "count": self.count,
+            "last": _round(self.last),
+            "p50": _round(self.percentile(50)),
+            "p95": _round(self.percentile(95)),
+            "max": _round(max(self._samples, default=None)),
+        }
+
+
+class EndpointMetrics:
+    """Request latency, response size, decode time and failures of one endpoint."""
+
+    def __init__(self):
+        self.latency_ms = RollingStats()
+        self.response_bytes = RollingStats()
+        self.decode_ms = RollingStats()
+        self.errors = 0
+        self.last_error = None
+
+    def as_dict(self) -> dict:
+        return {
+            "latency_ms": self.latency_ms.as_dict(),
+            "response_bytes": self.response_bytes.as_dict(),
+            "decode_ms": self.decode_ms.as_dict(),
+            "errors": self.errors,
+            "last_error": self.last_error,
+        }
+
+
+class JellyfinMetrics:
+    """Per-entry performance counters, filled by the coordinator and the status sensor."""
+
+    def __init__(self):
+        self.endpoints = {}  # endpoint -> EndpointMetrics
+        self.build_ms = RollingStats()  # Building the sensor state and attributes
+        self.state_writes = 0
+        self.skipped_writes = 0
+
+    def endpoint(self, endpoint: str) -> EndpointMetrics:
+        metrics = self.endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self.endpoints[endpoint] = EndpointMetrics()
+        return metrics
+
+    def record_error(self, endpoint: str, err: Exception) -> None:
+        metrics = self.endpoint(endpoint)
+        metrics.errors += 1
+        metrics.last_error = describe_error(err)
+
+    def as_dict(self) -> dict:
+        return {
+            "endpoints": {endpoint: metrics.as_dict() for endpoint, metrics in self.endpoints.items()},
+            "build_ms": self.build_ms.as_dict(),
+            "state_writes": self.state_writes,
+            "skipped_writes": self.skipped_writes,
+        }
@@ -0,0 +1,148 @@
+from dataclasses import asdict, dataclass
+from datetime import datetime
+
+from .metadata import ItemMetadataCache, derive_item_metadata
+
+ACTIVE_PLAY_STATES = ("Playing", "Paused")
+TICKS_PER_SECOND = 10_000_000
+
+
+@dataclass(slots=True)
+class JellyfinItem:
+    """The parts of a NowPlayingItem the sensors use, with stream details summarised."""
+
+    id: str | None
+    name: str
+    type: str
+    runtime_ticks: int
+    production_year: int | None
+    season_number: int | None
+    episode_number: int | None
+    official_rating: str
+    audio: str
+    quality: str
+    artist: str
+    series: str
+
+    @classmethod
+    def from_payload(cls, item: dict) -> "JellyfinItem":
+        return cls(
+            id=item.get("Id"),
+            name=item.get("Name", "Unknown"),
+            type=item.get("Type", "Unknown"),
+            runtime_ticks=item.get("RunTimeTicks") or 0,
+            production_year=item.get("ProductionYear"),
+            season_number=item.get("ParentIndexNumber"),
+            episode_number=item.get("IndexNumber"),
+            **derive_item_metadata(item),
+        )
+
+
+@dataclass(slots=True)
+class JellyfinSession:
+    """One /Sessions entry, parsed once per fetch."""
+
+    id: str
+    user: str
+    device: str
+    client: str
+    application_version: str | None
+    item: JellyfinItem | None
+    play_state: str
+    is_active: bool  # Has an item that is playing or paused
+    position_ticks: int
+    play_method: str
+    transcode_fps: int
+    transcode_completion: float | None
+    transcode_reasons: tuple
+    play_rate: float = 1.0
+
+    @classmethod
+    def from_payload(cls, session: dict, item_cache: ItemMetadataCache) -> "JellyfinSession":
+        play = session.get("PlayState") or {}
+        transcoding = session.get("TranscodingInfo") or {}
+        raw_item = session.get("NowPlayingItem")
+        item = item_cache.get(raw_item) if raw_item else None
+        play_state = session.get("PlaybackState") or ("Paused" if play.get("IsPaused") else "Playing")
+
+        try:
+            transcode_fps = int(float(transcoding.get("Framerate", 0)))
+        except (TypeError, ValueError):
+            transcode_fps = 0
+
+        return cls(
+            id=session.get("Id", "unknown_session"),
+            user=session.get("UserName", "Unknown"),
+            device=session.get("DeviceName", "Unknown Device"),
+            client=session.get("Client", "Unknown Client"),
+            application_version=session.get("ApplicationVersion"),
+            item=item,
+            play_state=play_state,
+            is_active=item is not None and play_state in ACTIVE_PLAY_STATES,
+            position_ticks=play.get("PositionTicks") or 0,
+            play_method=play.get("PlayMethod", "Unknown"),
+            transcode_fps=transcode_fps,
+            transcode_completion=transcoding.get("CompletionPercentage"),
+            transcode_reasons=tuple(transcoding.get("TranscodeReasons", ())),
+            play_rate=play.get("PlaybackRate") or 1.0,
+        )
+
+    def position_after(self, seconds: float) -> int:
+        """PositionTicks extrapolated `seconds` past the snapshot, for a session that is playing."""
+        if seconds <= 0 or not self.is_active or self.play_state != "Playing":
+            return self.position_ticks
+        ticks = self.position_ticks + int(seconds * self.play_rate * TICKS_PER_SECOND)
+        runtime = self.item.runtime_ticks
+        return min(ticks, runtime) if runtime > 0 else ticks
+
+    def as_dict(self) -> dict:
+        """JSON-safe form, for the stored warm-start snapshot."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "JellyfinSession":
+        item = data.get("item")
+        return cls(**{
+            **data,
+            "item": JellyfinItem(**item) if item else None,
+            "transcode_reasons": tuple(data.get("transcode_reasons", ())),
+        })
+
+
+@dataclass(slots=True)
+class JellyfinLibrary:
+    """One media folder from /Library/VirtualFolders, with its item counts."""
+
+    id: str
+    name: str
+    collection_type: str
+    item_count: int
+    recently_added: int
+
+    @classmethod
+    def from_payload(cls, folder: dict, items: dict, since: datetime) -> "JellyfinLibrary":
+        """folder is a VirtualFolders entry; items the newest-first /Items page for it."""
+        recently_added = 0
+        for item in items.get("Items") or []:
+            created = item.get("DateCreated")
+            try:
+                if not created or datetime.fromisoformat(created) < since:
+                    break
+            except ValueError:
+                break
+            recently_added += 1
+
+        return cls(
+            id=folder["ItemId"],
+            name=folder.get("Name", "Unknown"),
+            collection_type=folder.get("CollectionType") or "mixed",
+            item_count=items.get("TotalRecordCount") or 0,
+            recently_added=recently_added,
+        )
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "JellyfinLibrary":
+        return cls(**data)
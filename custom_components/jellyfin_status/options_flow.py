@@ -1,6 +1,18 @@
 from homeassistant import config_entries
 import voluptuous as vol
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    DEFAULT_COUNTS_INTERVAL,
+    COUNTS_INTERVAL_OPTIONS,
+    DEFAULT_PLAYBACK_FORMAT,
+    DEFAULT_REGISTRY_REFRESH_WINDOW,
+    REGISTRY_REFRESH_WINDOW_OPTIONS,
+    DEFAULT_POSITION_WRITE_INTERVAL,
+    POSITION_WRITE_INTERVAL_OPTIONS,
+    DEFAULT_POSITION_UPDATE_INTERVAL,
+    POSITION_UPDATE_INTERVAL_OPTIONS,
+)
+from .template import compile_template, InvalidTemplateError
 
 class JellyfinOptionsFlowHandler(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
@@ -14,7 +26,20 @@ class JellyfinOptionsFlowHandler(config_entries.OptionsFlow):
                 return self._config_entry.options[key]
             return self._config_entry.data.get(key, default)
 
+        errors = {}
+        placeholders = {"host": get_opt("host"), "placeholder": ""}
+
         if user_input is not None:
+            # Reject unknown placeholders now rather than at render time
+            playback_format = user_input.get("playback_format", "").strip()
+            try:
+                if playback_format:
+                    compile_template(playback_format)
+            except InvalidTemplateError as err:
+                errors["playback_format"] = "invalid_playback_format"
+                placeholders["placeholder"] = err.placeholder
+
+        if user_input is not None and not errors:
             # Preserve server_name internally; not exposed in form
             user_input["server_name"] = get_opt("server_name")
             return self.async_create_entry(title="", data=user_input)
@@ -55,6 +80,46 @@ class JellyfinOptionsFlowHandler(config_entries.OptionsFlow):
                         "translation_key": "scan_interval"
                     }
                 ): vol.In([0, 1, 5, 10, 15, 30, 60, 120]),
+                vol.Optional(
+                    "adaptive_polling",
+                    default=get_opt("adaptive_polling", False),
+                    description={
+                        "suggested_value": get_opt("adaptive_polling"),
+                        "translation_key": "adaptive_polling"
+                    }
+                ): bool,
+                vol.Required(
+                    "counts_interval",
+                    default=get_opt("counts_interval", DEFAULT_COUNTS_INTERVAL),
+                    description={
+                        "suggested_value": get_opt("counts_interval"),
+                        "translation_key": "counts_interval"
+                    }
+                ): vol.In(COUNTS_INTERVAL_OPTIONS),
+                vol.Required(
+                    "registry_refresh_window",
+                    default=get_opt("registry_refresh_window", DEFAULT_REGISTRY_REFRESH_WINDOW),
+                    description={
+                        "suggested_value": get_opt("registry_refresh_window"),
+                        "translation_key": "registry_refresh_window"
+                    }
+                ): vol.In(REGISTRY_REFRESH_WINDOW_OPTIONS),
+                vol.Required(
+                    "position_write_interval",
+                    default=get_opt("position_write_interval", DEFAULT_POSITION_WRITE_INTERVAL),
+                    description={
+                        "suggested_value": get_opt("position_write_interval"),
+                        "translation_key": "position_write_interval"
+                    }
+                ): vol.In(POSITION_WRITE_INTERVAL_OPTIONS),
+                vol.Required(
+                    "position_update_interval",
+                    default=get_opt("position_update_interval", DEFAULT_POSITION_UPDATE_INTERVAL),
+                    description={
+                        "suggested_value": get_opt("position_update_interval"),
+                        "translation_key": "position_update_interval"
+                    }
+                ): vol.In(POSITION_UPDATE_INTERVAL_OPTIONS),
                 vol.Optional(
                     "use_https",
                     default=get_opt("use_https", False),
@@ -71,9 +136,25 @@ class JellyfinOptionsFlowHandler(config_entries.OptionsFlow):
                         "translation_key": "ignore_ssl"
                     }
                 ): bool,
+                vol.Optional(
+                    "use_websocket",
+                    default=get_opt("use_websocket", False),
+                    description={
+                        "suggested_value": get_opt("use_websocket"),
+                        "translation_key": "use_websocket"
+                    }
+                ): bool,
+                vol.Optional(
+                    "session_entities",
+                    default=get_opt("session_entities", False),
+                    description={
+                        "suggested_value": get_opt("session_entities"),
+                        "translation_key": "session_entities"
+                    }
+                ): bool,
                 vol.Optional(
                     "playback_format",
-                    default=get_opt("playback_format", "{play_icon} {media_icon} {user}: {artist} – {title} ({playing_position}/{playback_runtime}) {playback_percentage}"),
+                    default=get_opt("playback_format", DEFAULT_PLAYBACK_FORMAT),
                     description={
                         "suggested_value": get_opt("playback_format"),
                                         "translation_key": "playback_format"
@@ -87,6 +168,22 @@ class JellyfinOptionsFlowHandler(config_entries.OptionsFlow):
                         "translation_key": "idle_message"
                     }
                 ): vol.All(str, vol.Length(min=0)),
+                vol.Optional(
+                    "diagnostic_sensors",
+                    default=get_opt("diagnostic_sensors", False),
+                    description={
+                        "suggested_value": get_opt("diagnostic_sensors"),
+                        "translation_key": "diagnostic_sensors"
+                    }
+                ): bool,
+                vol.Optional(
+                    "library_stats",
+                    default=get_opt("library_stats", False),
+                    description={
+                        "suggested_value": get_opt("library_stats"),
+                        "translation_key": "library_stats"
+                    }
+                ): bool,
                 vol.Optional(
                     "debug_payloads",
                     default=get_opt("debug_payloads", False),
@@ -96,7 +193,6 @@ class JellyfinOptionsFlowHandler(config_entries.OptionsFlow):
                     }
                 ): bool
             }),
-            description_placeholders={
-                "host": get_opt("host")
-            }
+            errors=errors,
+            description_placeholders=placeholders
         )
@@ -0,0 +1,51 @@
+import asyncio
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, MAX_CONCURRENT_POLLS
+
+
+class JellyfinPollScheduler:
+    """Spreads the poll phases of all entries and caps concurrent fetches.
+
+    Each registered entry gets an evenly spaced offset within its poll
+    period, so entries with the same scan_interval take turns instead of
+    all firing in the same tick after a restart.
+    """
+
+    def __init__(self):
+        self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_POLLS)
+        self._entries = []  # entry_ids in registration order
+
+    @callback
+    def register(self, entry_id: str) -> None:
+        if entry_id not in self._entries:
+            self._entries.append(entry_id)
+
+    @callback
+    def unregister(self, entry_id: str) -> None:
+        if entry_id in self._entries:
+            self._entries.remove(entry_id)
+
+    def offset(self, entry_id: str, period: float) -> float:
+        """Seconds into each period at which this entry should poll."""
+        if entry_id not in self._entries:
+            return 0.0
+        return period * self._entries.index(entry_id) / len(self._entries)
+
+    def delay(self, entry_id: str, period: float, now: float) -> float:
+        """Seconds from now until this entry's next slot, between half and one and a half periods."""
+        delay = period - (now - self.offset(entry_id, period)) % period
+        if delay < period / 2:
+            delay += period
+        return delay
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> JellyfinPollScheduler:
+    """Return the shared scheduler, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    scheduler = domain_data.get("scheduler")
+    if scheduler is None:
+        scheduler = domain_data["scheduler"] = JellyfinPollScheduler()
+    return scheduler
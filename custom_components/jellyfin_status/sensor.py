@@ -1,61 +1,131 @@
 import logging
-import os
-import aiofiles.os
-import json
 from datetime import timedelta
 import asyncio
-import re
+import time
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.const import STATE_UNAVAILABLE
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity_registry import async_get as async_get_registry
-from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+    async_track_time_interval,
+)
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 
 
 from typing import List
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    DEFAULT_PLAYBACK_FORMAT,
+    DEFAULT_POSITION_WRITE_INTERVAL,
+    DEFAULT_POSITION_UPDATE_INTERVAL,
+    STATISTICS_TRANSLATION_KEY,
+    ENDPOINT_SESSIONS,
+    ENDPOINT_COUNTS,
+)
+from .template import compile_template, InvalidTemplateError
+from .i18n import async_get_attribute_translations
+from .discovery import async_get_entity_index, get_jellyfin_sensor_entity_ids
 
 _LOGGER = logging.getLogger(__name__)
 SCAN_INTERVAL = timedelta(seconds=30)
 
-# Function to log available translation files
-async def async_log_translation_files():
-    translations_path = os.path.join(os.path.dirname(__file__), "translations")
-    try:
-        files = await aiofiles.os.listdir(translations_path)
-        json_files = [f for f in files if f.endswith(".json")]
-        _LOGGER.debug("Available translation files in %s: %s", translations_path, json_files)
-    except FileNotFoundError:
-        _LOGGER.debug("Translations directory not found at %s", translations_path)
-    except Exception as e:
-        _LOGGER.error("Error listing translation files in %s: %s", translations_path, e)
-
-
-# Registry-based Jellyfin sensor discovery
-async def get_jellyfin_sensor_entity_ids(hass: HomeAssistant) -> list[str]:
-    registry = async_get_registry(hass)
-    jellyfin_entities = []
-
-    for entry in registry.entities.values():
-        if (
-            entry.domain == "sensor"
-            and entry.platform == DOMAIN
-            and not entry.disabled_by
-            and entry.entity_category != EntityCategory.DIAGNOSTIC
-        ):
-            jellyfin_entities.append(entry.entity_id)
-
-    return jellyfin_entities
+MEDIA_ICONS = {"Audio": "🎵", "Movie": "🎬", "Episode": "📺"}
+SESSION_ICONS = {"Audio": "mdi:music", "Movie": "mdi:movie", "Episode": "mdi:television-classic"}
+
+# Change on every refresh, so they never justify a state write on their own
+VOLATILE_ATTRIBUTES = frozenset({"last_updated", "last_poll_duration_ms", "last_poll_queue_ms"})
+# Attributes that carry playback positions, compared per session field instead
+POSITION_ATTRIBUTES = frozenset({"currently_playing", "playback_states"})
+# playback_states fields that only move with the playhead
+POSITION_FIELDS = frozenset({"position", "progress_percent", "transcode_progress", "transcode_fps"})
+
+
+# Numeric sensors per server: key -> (name suffix, icon, unit)
+STATISTIC_SENSORS = {
+    "active_sessions": ("Active Sessions", "mdi:play-network", "sessions"),
+    "audio_sessions": ("Audio Sessions", "mdi:music", "sessions"),
+    "episode_sessions": ("Episode Sessions", "mdi:television-classic", "sessions"),
+    "movie_sessions": ("Movie Sessions", "mdi:movie", "sessions"),
+    "transcode_sessions": ("Transcoding Sessions", "mdi:cog-transfer", "sessions"),
+    "total_movies": ("Movies", "mdi:movie-open", "movies"),
+    "total_tv_shows": ("TV Shows", "mdi:television", "shows"),
+    "total_episodes": ("Episodes", "mdi:television-play", "episodes"),
+    "total_albums": ("Albums", "mdi:album", "albums"),
+    "total_tracks": ("Tracks", "mdi:music-note", "tracks"),
+}
+
+# Optional diagnostic sensors per server: key -> (name suffix, unit, state class, value from JellyfinMetrics)
+DIAGNOSTIC_SENSORS = {
+    "sessions_latency": ("Sessions Latency p95", "ms", SensorStateClass.MEASUREMENT,
+                         lambda m: m.endpoint(ENDPOINT_SESSIONS).latency_ms.percentile(95)),
+    "counts_latency": ("Counts Latency p95", "ms", SensorStateClass.MEASUREMENT,
+                       lambda m: m.endpoint(ENDPOINT_COUNTS).latency_ms.percentile(95)),
+    "sessions_size": ("Sessions Response Size", "B", SensorStateClass.MEASUREMENT,
+                      lambda m: m.endpoint(ENDPOINT_SESSIONS).response_bytes.last),
+    "sessions_decode": ("Sessions Decode Time p95", "ms", SensorStateClass.MEASUREMENT,
+                        lambda m: m.endpoint(ENDPOINT_SESSIONS).decode_ms.percentile(95)),
+    "build_time": ("State Build Time p95", "ms", SensorStateClass.MEASUREMENT,
+                   lambda m: m.build_ms.percentile(95)),
+    "state_writes": ("State Writes", None, SensorStateClass.TOTAL_INCREASING, lambda m: m.state_writes),
+    "skipped_writes": ("Skipped State Writes", None, SensorStateClass.TOTAL_INCREASING, lambda m: m.skipped_writes),
+}
+
+# Library statistics -> /Items/Counts field
+LIBRARY_COUNT_FIELDS = {
+    "total_movies": "MovieCount",
+    "total_tv_shows": "SeriesCount",
+    "total_episodes": "EpisodeCount",
+    "total_albums": "AlbumCount",
+    "total_tracks": "SongCount",
+}
+
+
+def _without(data: dict, keys) -> dict:
+    return {key: value for key, value in data.items() if key not in keys}
+
+
+def _ms(seconds):
+    return round(seconds * 1000) if seconds is not None else None
+
+# playback_format placeholder -> value, from a playback_states entry and the transcode fps
+TEMPLATE_VALUES = {
+    "user": lambda d, fps: d["user"],
+    "device": lambda d, fps: d["device"],
+    "client": lambda d, fps: d["client"],
+    "title": lambda d, fps: d["title"],
+    "official_rating": lambda d, fps: d["official_rating"],
+    "quality": lambda d, fps: d.get("quality", ""),
+    "audio": lambda d, fps: d.get("audio", ""),
+    "series": lambda d, fps: d.get("series", ""),
+    "season": lambda d, fps: d.get("season_number", ""),
+    "episode": lambda d, fps: d.get("episode_number", ""),
+    "artist": lambda d, fps: d.get("artist", ""),
+    "media_icon": lambda d, fps: MEDIA_ICONS.get(d["media_type"], "📺"),
+    "play_icon": lambda d, fps: "▶️" if d["play_state"] == "Playing" else "⏸️",
+    "playing_position": lambda d, fps: d["position"],
+    "playback_runtime": lambda d, fps: d["runtime"],
+    "playback_percentage": lambda d, fps: d["progress_percent"],
+    "play_method": lambda d, fps: d["play_method"],
+    "transcode_fps": lambda d, fps: fps,
+    "transcode_percentage": lambda d, fps: d.get("transcode_progress", "0%"),
+    "transcode_info": lambda d, fps: f" [⚡ {fps} fps]" if d["play_method"] == "Transcode" and fps > 0 else "",
+}
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = [JellyfinSensor(coordinator, entry, async_add_entities)]
+    status_sensor = JellyfinSensor(coordinator, entry, async_add_entities)
+    entities = [status_sensor]
+    entities.extend(JellyfinStatisticSensor(coordinator, status_sensor, key) for key in STATISTIC_SENSORS)
+    entities.append(JellyfinConnectionSensor(coordinator, status_sensor))
+    if entry.options.get("diagnostic_sensors", False):
+        entities.extend(JellyfinDiagnosticSensor(coordinator, status_sensor, key) for key in DIAGNOSTIC_SENSORS)
 
     domain_data = hass.data.setdefault(DOMAIN, {})
 
@@ -100,7 +170,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 
 # Self Healing Global Sensor, every 5 minutes...
     async def restore_globals_if_missing(now):
-        sensor_ids = await get_jellyfin_sensor_entity_ids(hass)
+        sensor_ids = get_jellyfin_sensor_entity_ids(hass)
         if sensor_ids:  # Only heal if some Jellyfin entities exist
             registry = async_get_registry(hass)
             global_ids = {"sensor.jellyfin_servers_total", "sensor.jellyfin_servers_error"}
@@ -120,6 +190,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 
 # Per-server Jellyfin status
 class JellyfinSensor(CoordinatorEntity, SensorEntity):
+    # Large or fast-changing; the counts are recorded by the statistic sensors instead
+    _unrecorded_attributes = frozenset({
+        "playback_states", "currently_playing", "libraries", *VOLATILE_ATTRIBUTES,
+        "active_session_count", "audio_session_count", "episode_session_count", "movie_session_count",
+        *LIBRARY_COUNT_FIELDS,
+    })
+
     def __init__(self, coordinator, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
         super().__init__(coordinator)
         self.entry = entry
@@ -127,6 +204,7 @@ class JellyfinSensor(CoordinatorEntity, SensorEntity):
         server_name = entry.options.get("server_name") or entry.title or "Jellyfin"
         slug = server_name.lower().replace(" ", "_").replace("-", "_")
 
+        self._server_name = server_name
         self._attr_name = f"{server_name} Status"
         self._attr_unique_id = f"{DOMAIN}_{slug}"
         self._attr_translation_key = "jellyfin_playback_sensor"
@@ -135,63 +213,154 @@ class JellyfinSensor(CoordinatorEntity, SensorEntity):
         self._language = None 
         self._attr_should_poll = False
 
-    async def async_added_to_hass(self):
-        # Log available translation files at startup
-        await async_log_translation_files()
+        # Derived state, computed once per coordinator snapshot
+        self._snapshot_revision = None
+        self._snapshot_value = None
+        self._snapshot_attrs = {}
+        self._statistics = {}
+        self._set_template(self._compile_playback_format())
+
+        # Optional child entity per active session, keyed by session Id
+        self._session_entities_enabled = entry.options.get("session_entities", False)
+        self._session_entities = {}
+        self._session_states = {}
+
+        # What was last written, so unchanged snapshots skip the state write
+        self._position_write_interval = entry.options.get("position_write_interval", DEFAULT_POSITION_WRITE_INTERVAL)
+        self._written = None
+        self._written_significant = None
+        self._written_at = 0.0
+
+        # Positions of playing sessions are extrapolated locally between polls
+        self._position_update_interval = entry.options.get("position_update_interval", DEFAULT_POSITION_UPDATE_INTERVAL)
+        self._interpolation_tick = 0
+
+    def _compile_playback_format(self):
+        template = self.entry.options.get("playback_format", "").strip()
+        if not template:
+            return None
+        try:
+            return compile_template(template)
+        except InvalidTemplateError as err:
+            # Options saved before validation existed; fall back to the default layout
+            _LOGGER.error("%s — using the default playback format", err)
+            return compile_template(DEFAULT_PLAYBACK_FORMAT)
+
+    def _set_template(self, template):
+        self._template = template
+        self._template_getters = [
+            (field, TEMPLATE_VALUES[field]) for field in template.fields
+        ] if template else []
+
+    def _render(self, user_data: dict, trans_fps) -> str:
+        """Render one session with the playback format, falling back to the default on errors."""
+        context = {field: getter(user_data, trans_fps) for field, getter in self._template_getters}
+        try:
+            return self._template.render(context)
+        except (KeyError, ValueError, TypeError) as err:
+            if self._template.template == DEFAULT_PLAYBACK_FORMAT:
+                raise
+            _LOGGER.error("Playback format failed to render (%s) — using the default playback format", err)
+            self._set_template(compile_template(DEFAULT_PLAYBACK_FORMAT))
+            return self._render(user_data, trans_fps)
 
+    async def async_added_to_hass(self):
         self._language = self.hass.config.language.split('-')[0]
-
-        # --- Manual Translation Loading Workaround ---
-        translation_file_path = os.path.join(
-            os.path.dirname(__file__),
-            "translations",
-            f"{self._language}.json"
-        )
-
-        # Fallback to 'en.json' if the specific language file doesn't exist
-        if not await aiofiles.os.path.exists(translation_file_path):
-            translation_file_path = os.path.join(
-                os.path.dirname(__file__),
-                "translations",
-                "en.json"
-            )
-
-        loaded_translations_data = {}
-        try:
-            async with aiofiles.open(translation_file_path, mode='r', encoding='utf-8') as f:
-                content = await f.read()
-                raw_json_data = json.loads(content)
-
-                # Extract the relevant 'state_attributes' translations for jellyfin_playback_sensor
-                # Path: entity.sensor.jellyfin_playback_sensor.state_attributes
-                entity_path = raw_json_data.get("entity", {}).get("sensor", {}).get("jellyfin_playback_sensor", {})
-                if "state_attributes" in entity_path:
-                    loaded_translations_data = entity_path["state_attributes"]
-                    _LOGGER.debug("Manually loaded state_attributes translations: %s", loaded_translations_data)
-                else:
-                    _LOGGER.warning("Could not find entity.sensor.jellyfin_playback_sensor.state_attributes in %s.", translation_file_path)
-
-        except FileNotFoundError:
-            _LOGGER.error("Translation file not found at %s", translation_file_path)
-        except json.JSONDecodeError as e:
-            _LOGGER.error("Error decoding JSON from translation file %s: %s", translation_file_path, e)
-        except Exception as e:
-            _LOGGER.error("Unexpected error during manual translation loading: %s", e)
-
-        self._translations = loaded_translations_data
-        # --- End of Manual Translation Loading Workaround ---
+        self._translations = await async_get_attribute_translations(self.hass, self._attr_translation_key)
 
         _LOGGER.debug("Loaded translations language: %s", self._language)
         _LOGGER.debug("Final _translations dict: %s", self._translations)
         _LOGGER.debug("Translation keys available for _t: %s", list(self._translations.keys()))
 
 
-        self.coordinator.async_add_listener(self._handle_coordinator_update)
-        await self.coordinator.async_request_refresh()
+        # Registers _handle_coordinator_update (and removes it again on unload)
+        await super().async_added_to_hass()
+
+        if self._position_update_interval:
+            self.async_on_remove(async_track_time_interval(
+                self.hass, self._handle_interpolation_tick, timedelta(seconds=self._position_update_interval)
+            ))
 
 
+    async def async_will_remove_from_hass(self):
+        await super().async_will_remove_from_hass()
+        for entity in self._session_entities.values():
+            if entity.hass is not None:
+                await entity.async_remove()
+        self._session_entities.clear()
+
     def _handle_coordinator_update(self) -> None:
-        self.async_write_ha_state()
+        if self._state_changed():
+            self.coordinator.metrics.state_writes += 1
+            self.async_write_ha_state()
+        else:
+            self.coordinator.metrics.skipped_writes += 1
+        if self._session_entities_enabled:
+            self._sync_session_entities()
+
+    @callback
+    def _handle_interpolation_tick(self, now) -> None:
+        """Rebuild with extrapolated positions while something is playing; polls correct them."""
+        if not self.coordinator.last_update_success or self.coordinator.sessions_received is None:
+            return
+        if any(s.is_active and s.play_state == "Playing" for s in self.coordinator.data or []):
+            self._interpolation_tick += 1
+            self._handle_coordinator_update()
+
+    def _state_changed(self) -> bool:
+        """Return True if state or attributes differ from what was last written.
+
+        Play/pause/start/stop write at once; when position_write_interval is
+        set, changes that only move playback positions wait for that interval.
+        """
+        value, attrs = self._snapshot()
+        available = self.coordinator.last_update_success
+        written = (available, value, _without(attrs, VOLATILE_ATTRIBUTES))
+        if written == self._written:
+            return False
+
+        significant = (
+            available,
+            value,
+            _without(attrs, VOLATILE_ATTRIBUTES | POSITION_ATTRIBUTES),
+            {session_id: _without(data, POSITION_FIELDS) for session_id, data in self._session_states.items()},
+        )
+        now = time.monotonic()
+        if (
+            self._position_write_interval
+            and significant == self._written_significant
+            and now - self._written_at < self._position_write_interval
+        ):
+            return False
+
+        self._written, self._written_significant, self._written_at = written, significant, now
+        return True
+
+    def _sync_session_entities(self):
+        """Add, update or remove session entities so they match the current sessions."""
+        self._snapshot()
+        playback_states = self._session_states
+        available = self.coordinator.last_update_success
+
+        for session_id in list(self._session_entities):
+            if session_id not in playback_states:
+                entity = self._session_entities.pop(session_id)
+                if entity.hass is not None:
+                    self.hass.async_create_task(entity.async_remove())
+
+        new_entities = []
+        for session_id, data in playback_states.items():
+            entity = self._session_entities.get(session_id)
+            if entity is None:
+                entity = JellyfinSessionSensor(self._server_name, session_id, data)
+                self._session_entities[session_id] = entity
+                new_entities.append(entity)
+            else:
+                # Writes state only if this session's data actually changed
+                entity.async_update_session(data, available, self._position_write_interval)
+
+        if new_entities:
+            self._async_add_entities(new_entities)
 
     # Modified: _t method to use the manually loaded _translations
     def _t(self, key: str, fallback: str = None) -> str:
@@ -202,27 +371,39 @@ class JellyfinSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self):
         """Return the main state of the sensor (Active or Idle)."""
-        sessions = self.coordinator.data or []
-        active_count = 0
-
-        for session in sessions:
-            item = session.get("NowPlayingItem")
-            # Using the same logic as the attributes to define 'Active'
-            play_state = session.get("PlaybackState") or ("Paused" if session.get("PlayState", {}).get("IsPaused") else "Playing")
-            if item and play_state in ["Playing", "Paused"]:
-                active_count += 1
-
-        return "Active" if active_count > 0 else "Idle"
+        return self._snapshot()[0]
 
     @property
     def extra_state_attributes(self):
+        return self._snapshot()[1]
+
+    def _snapshot(self):
+        """Return (state, attributes), rebuilt only when the coordinator has new data."""
+        revision = (self.coordinator.data_revision, self._interpolation_tick)
+        if self._snapshot_revision != revision:
+            started = time.perf_counter()
+            self._snapshot_value, self._snapshot_attrs = self._build_snapshot()
+            self._snapshot_revision = revision
+            self.coordinator.metrics.build_ms.add((time.perf_counter() - started) * 1000)
+        return self._snapshot_value, self._snapshot_attrs
+
+    def statistics(self) -> dict:
+        """Numeric values for the statistic sensors, from the current snapshot."""
+        self._snapshot()
+        return self._statistics
+
+    def _build_snapshot(self):
         # 1. Initialize base attributes
         counts = self.coordinator.library_counts or {}
 
         attrs = {
             "friendly_name": self._friendly_name,
             "polling_enabled": self.coordinator.update_interval is not None,
-            "polling_interval_seconds": int(self.coordinator.update_interval.total_seconds()) if self.coordinator.update_interval else 0,
+            "polling_interval_seconds": int(self.coordinator.nominal_interval.total_seconds()) if self.coordinator.nominal_interval else 0,
+            "current_polling_interval_seconds": int(self.coordinator.poll_interval.total_seconds()) if self.coordinator.poll_interval else 0,
+            "poll_offset_seconds": round(self.coordinator.poll_offset, 1),
+            "last_poll_duration_ms": _ms(self.coordinator.last_poll_duration),
+            "last_poll_queue_ms": _ms(self.coordinator.last_poll_wait),
             "last_updated": self.coordinator.last_updated,
             "server_version": self.coordinator.application_version or "unknown",
 
@@ -234,125 +415,71 @@ class JellyfinSensor(CoordinatorEntity, SensorEntity):
             "total_tracks": counts.get("SongCount", 0)
         }
 
-        template = self.entry.options.get("playback_format", "").strip()
+        template = self._template
         sessions = self.coordinator.data or []
+        received = self.coordinator.sessions_received
+        elapsed = time.monotonic() - received if self._position_update_interval and received else 0
         active = []
+        type_counts = {}
+        transcode_count = 0
 
         # 2. Filter for truly active sessions
         for session in sessions:
-            item = session.get("NowPlayingItem")
-            play_state = session.get("PlaybackState") or ("Paused" if session.get("PlayState", {}).get("IsPaused") else "Playing")
-            if item and play_state in ["Playing", "Paused"]:
-                active.append((session.get("UserName", "Unknown"), item, session))
+            if session.is_active:
+                active.append(session)
+                media_type = session.item.type
+                type_counts[media_type] = type_counts.get(media_type, 0) + 1
 
         # 3. Process sorted sessions
-        sorted_sessions = sorted(active, key=lambda x: (x[0].lower(), x[1].get("Name", "").lower()))
+        sorted_sessions = sorted(active, key=lambda s: (s.user.lower(), s.item.name.lower()))
         playback_states = {}
         template_phrases = []
 
-        for user, item, session in sorted_sessions:
-            # --- Data Extraction ---
-            session_id = session.get("Id", "unknown_session")
-            device_name = session.get("DeviceName", "Unknown Device")
-            client_app = session.get("Client", "Unknown Client")
-            media_type = item.get("Type", "Unknown")
-            title = item.get("Name", "Unknown")
-            artist = next(iter(item.get("Artists", [])), item.get("AlbumArtist", "Unknown"))
-            series = item.get("SeriesName", "Unknown")
-            
-            # --- Global Rating Cleaner ---
-            raw_rating = item.get("OfficialRating", "")
-
-            if raw_rating:
-                # Split by '/' or ';' in case of duplicates and take the first one
-                clean_rating = re.split(r'[;/]', raw_rating)[0].strip()
-    
-                # Remove prefixes like "US:", "United States:", "Germany:FSK-", etc.
-                # This looks for a colon and takes everything after it
-                if ":" in clean_rating:
-                    clean_rating = clean_rating.split(":")[-1].strip()
-
-                # Final cleanup: remove the word "Rated" if it's still there
-                official_rating = clean_rating.replace("Rated", "").strip()
-            else:
-                official_rating = ""
-            
-            # --- Audio Stream Info ---
-            streams = item.get("MediaStreams", [])
-            audio_stream = next((s for s in streams if s.get("Type") == "Audio"), {})
-            codec = audio_stream.get("Codec", "").upper()
-            channels = audio_stream.get("Channels")
-            channel_map = {1: "Mono", 2: "Stereo", 6: "5.1", 8: "7.1"}
-            channel_label = channel_map.get(channels, f"{channels}ch") if channels else ""
-            audio_info = f"{codec} {channel_label}".strip() if codec else ""
+        for session in sorted_sessions:
+            item = session.item
+            media_type = item.type
+            title = item.name
 
             # --- Timing ---
-            ticks = session.get("PlayState", {}).get("PositionTicks", 0)
-            runtime = item.get("RunTimeTicks", 0)
+            ticks = session.position_after(elapsed)
+            runtime = item.runtime_ticks
             percent = int((ticks / runtime) * 100) if ticks > 0 and runtime > 0 else 0
 
             # --- Transcoding Info ---
-            trans_info = session.get("TranscodingInfo", {})
-            play_method = session.get("PlayState", {}).get("PlayMethod", "Unknown")
-            try:
-                trans_fps = int(float(trans_info.get("Framerate", 0)))
-            except (TypeError, ValueError):
-                trans_fps = 0
+            play_method = session.play_method
+            trans_fps = session.transcode_fps
 
             t_percent_val = "0%"
-            if "CompletionPercentage" in trans_info:
-                t_percent_val = f"{round(trans_info.get('CompletionPercentage'), 1)}%"
+            if session.transcode_completion is not None:
+                t_percent_val = f"{round(session.transcode_completion, 1)}%"
             elif play_method == "Transcode":
                 t_percent_val = "100%"
 
-            # --- Video Quality ---
-            vid_stream = next((s for s in streams if s.get("Type") == "Video"), {})
-            width = vid_stream.get("Width", 0)
-            v_range = vid_stream.get("VideoRange", "")
-            
-            if width >= 3840: res = "4K"
-            elif width >= 1920: res = "1080p"
-            elif width >= 1280: res = "720p"
-            elif width >= 720: res = "480p"
-            else: res = f"{width}p" if width > 0 else ""
-
-            quality = f"{res} {v_range}" if "SDR" not in v_range and v_range else res
-            quality = quality.strip()
-
-            # --- Status Icons ---
-            status = session.get("PlaybackState") or ("Paused" if session.get("PlayState", {}).get("IsPaused") else "Playing")
-            emoji = {"Audio": "🎵", "Movie": "🎬", "Episode": "📺"}.get(media_type, "📺")
-            status_emoji = "▶️" if status == "Playing" else "⏸️"
-
             # --- 4. Fill the raw data dictionary (playback_states) ---
             user_data = {
-                "user": user,
-                "device": device_name,
-                "client": client_app,
+                "user": session.user,
+                "device": session.device,
+                "client": session.client,
                 "media_type": media_type,
                 "title": title,
-                "official_rating": official_rating
+                "official_rating": item.official_rating
             }
 
-            if quality: user_data["quality"] = quality
-            if audio_info: user_data["audio"] = audio_info
-            
-            user_data["title"] = title
+            if item.quality: user_data["quality"] = item.quality
+            if item.audio: user_data["audio"] = item.audio
 
             if media_type == "Episode":
-                if series and series != "Unknown": user_data["series"] = series
-                p_idx = item.get("ParentIndexNumber")
-                idx = item.get("IndexNumber")
-                if p_idx is not None: user_data["season_number"] = p_idx
-                if idx is not None: user_data["episode_number"] = idx
+                if item.series and item.series != "Unknown": user_data["series"] = item.series
+                if item.season_number is not None: user_data["season_number"] = item.season_number
+                if item.episode_number is not None: user_data["episode_number"] = item.episode_number
             elif media_type == "Audio":
-                if artist and artist != "Unknown": user_data["artist"] = artist
+                if item.artist and item.artist != "Unknown": user_data["artist"] = item.artist
 
-            if item.get("ProductionYear"):
-                user_data["year"] = item.get("ProductionYear")
+            if item.production_year:
+                user_data["year"] = item.production_year
 
             user_data.update({
-                "play_state": status,
+                "play_state": session.play_state,
                 "position": self._format_position(ticks) if ticks > 0 else "00:00:00",
                 "runtime": self._format_position(runtime) if runtime > 0 else "00:00:00",
                 "progress_percent": f"{percent}%",
@@ -360,58 +487,55 @@ class JellyfinSensor(CoordinatorEntity, SensorEntity):
             })
 
             if play_method == "Transcode":
+                transcode_count += 1
                 user_data["transcode_progress"] = t_percent_val
                 if t_percent_val != "100%": user_data["transcode_fps"] = trans_fps
-                user_data["transcode_reasons"] = ", ".join(trans_info.get("TranscodeReasons", []))
-
-            playback_states[session_id] = user_data
+                user_data["transcode_reasons"] = ", ".join(session.transcode_reasons)
 
-            # --- 5. Fill the Template Context ---
-            t_info = f" [⚡ {trans_fps} fps]" if play_method == "Transcode" and trans_fps > 0 else ""
-
-            context = {
-                "user": user,
-                "device": device_name,
-                "client": client_app,
-                "title": title,
-                "official_rating": official_rating,
-                "quality": quality,
-                "audio": audio_info,
-                "series": user_data.get("series", ""),
-                "season": user_data.get("season_number", ""),
-                "episode": user_data.get("episode_number", ""),
-                "artist": user_data.get("artist", ""),
-                "media_icon": emoji,
-                "play_icon": status_emoji,
-                "playing_position": user_data["position"],
-                "playback_runtime": user_data["runtime"],
-                "playback_percentage": user_data["progress_percent"],
-                "play_method": play_method,
-                "transcode_fps": trans_fps,
-                "transcode_percentage": user_data.get("transcode_progress", "0%"),
-                "transcode_info": t_info 
-            }
+            playback_states[session.id] = user_data
 
+            # --- 5. Render the template (only the fields it references) ---
             if template:
-                try:
-                    rendered = template.format(**context)
-                    rendered = re.sub(r"^\s*[–-]\s*", "", rendered)
-                    rendered = re.sub(r":\s*[–-]\s*", ": ", rendered) 
-                    template_phrases.append(rendered.strip())
-                except KeyError as e:
-                    template_phrases.append(f"⚠️ Missing key: {{{e.args[0]}}}")
+                template_phrases.append(self._render(user_data, trans_fps))
 
         # 7. Final assignment
         idle_msg = self.entry.options.get("idle_message", "Idle")
         attrs["currently_playing"] = "\n".join(template_phrases) if template_phrases else idle_msg
         attrs["active_session_count"] = len(active)
-        attrs["audio_session_count"] = sum(1 for _, itm, _ in active if itm.get("Type") == "Audio")
-        attrs["episode_session_count"] = sum(1 for _, itm, _ in active if itm.get("Type") == "Episode")
-        attrs["movie_session_count"] = sum(1 for _, itm, _ in active if itm.get("Type") == "Movie")
-        attrs["playback_states"] = playback_states
+        attrs["audio_session_count"] = type_counts.get("Audio", 0)
+        attrs["episode_session_count"] = type_counts.get("Episode", 0)
+        attrs["movie_session_count"] = type_counts.get("Movie", 0)
+        if not self._session_entities_enabled:
+            attrs["playback_states"] = playback_states
+        self._session_states = playback_states
         attrs["provider"] = "__jellyfin_status__"
 
-        return attrs
+        # Per-library breakdown, only when library statistics are enabled
+        if self.coordinator.libraries is not None:
+            attrs["libraries"] = {
+                library.name: {
+                    "collection_type": library.collection_type,
+                    "item_count": library.item_count,
+                    "recently_added": library.recently_added,
+                }
+                for library in self.coordinator.libraries
+            }
+
+        # Library totals stay unknown until /Items/Counts has answered once
+        library_counts = self.coordinator.library_counts if self.coordinator.counts_received else None
+        self._statistics = {
+            "active_sessions": len(active),
+            "audio_sessions": attrs["audio_session_count"],
+            "episode_sessions": attrs["episode_session_count"],
+            "movie_sessions": attrs["movie_session_count"],
+            "transcode_sessions": transcode_count,
+            **{
+                key: library_counts.get(field, 0) if library_counts is not None else None
+                for key, field in LIBRARY_COUNT_FIELDS.items()
+            },
+        }
+
+        return ("Active" if active else "Idle"), attrs
 
 
     def _format_position(self, ticks: int) -> str:
@@ -423,6 +547,140 @@ class JellyfinSensor(CoordinatorEntity, SensorEntity):
 
 
 
+# One active playback session, only present while the session lasts
+class JellyfinSessionSensor(SensorEntity):
+    _attr_should_poll = False
+    _unrecorded_attributes = POSITION_FIELDS
+
+    def __init__(self, server_name: str, session_id: str, data: dict):
+        self._session_id = session_id
+        self._data = data
+        self._available = True
+        self._written_at = time.monotonic()
+        self._attr_name = f"{server_name} {data.get('user', 'Unknown')} {data.get('device', 'Unknown Device')}"
+        self._attr_icon = SESSION_ICONS.get(data.get("media_type"), "mdi:play-circle")
+
+    @property
+    def available(self) -> bool:
+        return self._available
+
+    @property
+    def native_value(self):
+        return self._data.get("play_state")
+
+    @property
+    def extra_state_attributes(self):
+        return {"session_id": self._session_id, **self._data}
+
+    def async_update_session(self, data: dict, available: bool = True, position_write_interval: int = 0) -> None:
+        # self._data is what was last written
+        if data == self._data and available == self._available:
+            return
+        now = time.monotonic()
+        if (
+            position_write_interval
+            and available == self._available
+            and _without(data, POSITION_FIELDS) == _without(self._data, POSITION_FIELDS)
+            and now - self._written_at < position_write_interval
+        ):
+            return
+        self._data = data
+        self._available = available
+        self._written_at = now
+        self._attr_icon = SESSION_ICONS.get(data.get("media_type"), "mdi:play-circle")
+        self.async_write_ha_state()
+
+
+# Numeric per-server counter, recorded as long-term statistics
+class JellyfinStatisticSensor(CoordinatorEntity, SensorEntity):
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_should_poll = False
+
+    def __init__(self, coordinator, status_sensor: JellyfinSensor, key: str):
+        super().__init__(coordinator)
+        name, icon, unit = STATISTIC_SENSORS[key]
+        self._status_sensor = status_sensor
+        self._key = key
+        self._attr_name = f"{status_sensor._server_name} {name}"
+        self._attr_unique_id = f"{status_sensor.unique_id}_{key}"
+        self._attr_translation_key = STATISTICS_TRANSLATION_KEY
+        self._attr_icon = icon
+        self._attr_native_unit_of_measurement = unit
+        self._written = None
+
+    @property
+    def native_value(self):
+        return self._status_sensor.statistics().get(self._key)
+
+    def _handle_coordinator_update(self) -> None:
+        written = (self.coordinator.last_update_success, self.native_value)
+        if written != self._written:
+            self._written = written
+            self.async_write_ha_state()
+
+
+# Per-server performance metric, only created when diagnostic_sensors is enabled
+class JellyfinDiagnosticSensor(CoordinatorEntity, SensorEntity):
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_should_poll = False
+
+    def __init__(self, coordinator, status_sensor: JellyfinSensor, key: str):
+        super().__init__(coordinator)
+        name, unit, state_class, self._value = DIAGNOSTIC_SENSORS[key]
+        self._attr_name = f"{status_sensor._server_name} {name}"
+        self._attr_unique_id = f"{status_sensor.unique_id}_{key}"
+        self._attr_icon = "mdi:speedometer"
+        self._attr_native_unit_of_measurement = unit
+        self._attr_state_class = state_class
+        self._written = None
+
+    @property
+    def native_value(self):
+        value = self._value(self.coordinator.metrics)
+        return round(value, 1) if isinstance(value, float) else value
+
+    def _handle_coordinator_update(self) -> None:
+        written = (self.coordinator.last_update_success, self.native_value)
+        if written != self._written:
+            self._written = written
+            self.async_write_ha_state()
+
+
+class JellyfinConnectionSensor(CoordinatorEntity, SensorEntity):
+    """Circuit breaker state (closed / open / half_open); stays available while the server is down."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_should_poll = False
+    _unrecorded_attributes = frozenset({"last_error", "next_probe"})
+
+    def __init__(self, coordinator, status_sensor: JellyfinSensor):
+        super().__init__(coordinator)
+        self._attr_name = f"{status_sensor._server_name} Connection"
+        self._attr_unique_id = f"{status_sensor.unique_id}_connection"
+        self._attr_icon = "mdi:lan-connect"
+        self._written = None
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    @property
+    def native_value(self):
+        return self.coordinator.breaker.state
+
+    @property
+    def extra_state_attributes(self):
+        state = self.coordinator.breaker.as_dict()
+        del state["state"]
+        return state
+
+    def _handle_coordinator_update(self) -> None:
+        written = tuple(self.coordinator.breaker.as_dict().values())
+        if written != self._written:
+            self._written = written
+            self.async_write_ha_state()
+
+
 # Global Jellyfin diagnostics
 class JellyfinGlobalSensor(SensorEntity):
     def __init__(self, hass: HomeAssistant, sensor_type: str):
@@ -439,6 +697,8 @@ class JellyfinGlobalSensor(SensorEntity):
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
         self._debounce_handle = None
+        self._index = None
+        self._unsub_states = None
         self._attached_entity_id = None
         self._last_entity_ids = []
 
@@ -448,59 +708,40 @@ class JellyfinGlobalSensor(SensorEntity):
     async def async_added_to_hass(self):
         # Set language code
         self._language = self._hass.config.language.split("-")[0]
+        self._translations = await async_get_attribute_translations(self._hass, self._attr_translation_key)
 
-        # --- Manual Translation Loading Workaround ---
-        translation_file_path = os.path.join(
-            os.path.dirname(__file__), "translations", f"{self._language}.json"
+        # Register refresh and listen hooks
+        async_call_later(self._hass, 10, lambda _: self._hass.create_task(self._refresh(retry=True)))
+        self.async_on_remove(
+            async_track_time_interval(self._hass, lambda _: self._hass.create_task(self._refresh()), timedelta(seconds=30))
         )
 
-        if not await aiofiles.os.path.exists(translation_file_path):
-            _LOGGER.warning("🌐 Missing translation for '%s', falling back to English.", self._language)
-            translation_file_path = os.path.join(
-                os.path.dirname(__file__), "translations", "en.json"
-            )
-
-        loaded_translations_data = {}
-        try:
-            async with aiofiles.open(translation_file_path, mode='r', encoding='utf-8') as f:
-                content = await f.read()
-                raw_json_data = json.loads(content)
-
-                # Extract translation section from entity.sensor.<translation_key>.state_attributes
-                entity_path = raw_json_data.get("entity", {}).get("sensor", {}).get(self._attr_translation_key, {})
-                if "state_attributes" in entity_path:
-                    loaded_translations_data = entity_path["state_attributes"]
-                    _LOGGER.debug("🌍 Loaded state_attributes translations: %s", loaded_translations_data)
-                else:
-                    _LOGGER.warning(
-                        "⚠️ No translations found under entity.sensor.%s.state_attributes in %s",
-                        self._attr_translation_key, translation_file_path
-                    )
-
-        except FileNotFoundError:
-            _LOGGER.error("❌ Translation file not found at %s", translation_file_path)
-        except json.JSONDecodeError as e:
-            _LOGGER.error("🧨 JSON decode error from translation file %s: %s", translation_file_path, e)
-        except Exception as e:
-            _LOGGER.error("💥 Unexpected error during translation loading: %s", e)
-
-        self._translations = loaded_translations_data
-        # --- End of Manual Translation Loading Workaround ---
+        # Only follow Jellyfin entities: registry changes come from the shared index,
+        # state changes are tracked for the indexed entity IDs alone
+        self._index = async_get_entity_index(self._hass)
+        self.async_on_remove(self._index.async_add_listener(self._handle_index_update))
+        self.async_on_remove(self._unsubscribe_states)
+        self._subscribe_states()
+
+    def _subscribe_states(self):
+        self._unsubscribe_states()
+        self._unsub_states = async_track_state_change_event(
+            self._hass, list(self._index.entity_ids), self._handle_state_change
+        )
 
-        # Register refresh and listen hooks
-        async_call_later(self._hass, 10, lambda _: self._hass.create_task(self._refresh(retry=True)))
-        async_track_time_interval(self._hass, lambda _: self._hass.create_task(self._refresh()), timedelta(seconds=30))
-        self._hass.bus.async_listen(EVENT_ENTITY_REGISTRY_UPDATED, self._handle_registry_update)
-        self._hass.bus.async_listen("state_changed", self._handle_state_change)
+    def _unsubscribe_states(self):
+        if self._unsub_states:
+            self._unsub_states()
+            self._unsub_states = None
 
     def _t(self, key: str, fallback: str = None) -> str:
         translated_value = self._translations.get(key, {}).get("name")
         return translated_value if translated_value is not None else fallback if fallback is not None else key
 
-    async def _handle_registry_update(self, event):
-        if event.data.get("action") in ("create", "remove"):
-            _LOGGER.debug("📡 Registry update detected: %s", event.data.get("action"))
-            self._debounce_refresh()
+    def _handle_index_update(self, config_entry_ids):
+        _LOGGER.debug("📡 Jellyfin entity index changed")
+        self._subscribe_states()
+        self._debounce_refresh()
 
     async def _handle_state_change(self, event):
         entity_id = event.data.get("entity_id")
@@ -510,7 +751,6 @@ class JellyfinGlobalSensor(SensorEntity):
         if (
             entity_id
             and new_state
-            and entity_id.startswith("sensor.jellyfin")
             and (
                 new_state.state == STATE_UNAVAILABLE
                 or (old_state and old_state.state == STATE_UNAVAILABLE and new_state.state != STATE_UNAVAILABLE)
@@ -530,7 +770,7 @@ class JellyfinGlobalSensor(SensorEntity):
         self._debounce_handle = async_call_later(self._hass, delay, _trigger)
 
     async def _refresh(self, retry=False):
-        entity_ids = await get_jellyfin_sensor_entity_ids(self._hass)
+        entity_ids = list(self._index.entity_ids)
 
         if retry and not entity_ids:
             _LOGGER.warning("🕵️ JellyfinGlobalSensor found no entities — retrying in 10s")
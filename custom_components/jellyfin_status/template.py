@@ -0,0 +1,118 @@
+import re
+from functools import lru_cache
+from string import Formatter
+
+from homeassistant.exceptions import HomeAssistantError
+
+# Placeholders available in the playback_format option
+TEMPLATE_FIELDS = frozenset({
+    "user", "device", "client", "title", "official_rating", "quality", "audio",
+    "series", "season", "episode", "artist", "media_icon", "play_icon",
+    "playing_position", "playback_runtime", "playback_percentage", "play_method",
+    "transcode_fps", "transcode_percentage", "transcode_info",
+})
+# Fields that may hold an int or "" depending on the session, so a format spec
+# on them is only safe after a !s/!r/!a conversion
+NON_STR_FIELDS = frozenset({"season", "episode", "transcode_fps"})
+
+_FORMATTER = Formatter()
+_LEADING_DASH = re.compile(r"^\s*[–-]\s*")
+_COLON_DASH = re.compile(r":\s*[–-]\s*")
+_CONVERSIONS = {"r": repr, "s": str, "a": ascii}
+
+
+class InvalidTemplateError(HomeAssistantError):
+    """Raised when a playback_format contains an unknown or malformed placeholder."""
+
+    def __init__(self, placeholder: str):
+        super().__init__(f"Invalid placeholder in playback format: {placeholder}")
+        self.placeholder = placeholder
+
+
+def _valid_str_spec(spec: str, field_name: str, conversion) -> bool:
+    """True if the spec always works at render time, i.e. on any string value."""
+    if "{" in spec or (field_name in NON_STR_FIELDS and not conversion):
+        return False
+    try:
+        format("", spec)
+    except ValueError:
+        return False
+    return True
+
+
+class PlaybackTemplate:
+    """A playback_format string parsed once into literal/field pieces.
+
+    Rendering follows str.format() with a dash cleanup similar to the old
+    regex passes: a leading "–" is dropped and ": –" collapses into ": ",
+    which is what's left when a field like {artist} renders empty. The
+    cleanup only looks at the template's own text, so the output differs
+    from the old regexes in two cases: dashes inside field values (e.g. a
+    title containing ": -") are left alone, and repeated empty segments
+    collapse fully ("{user}: {artist} – {series} – {title}" with no artist
+    or series gives "Bob: Alien" where the regexes gave "Bob: – Alien").
+    """
+
+    def __init__(self, template: str):
+        self.template = template
+        self.pieces = []
+        fields = []
+
+        try:
+            parsed = list(_FORMATTER.parse(template))
+        except ValueError as err:
+            raise InvalidTemplateError(str(err)) from err
+
+        for literal, field_name, spec, conversion in parsed:
+            # Dashes that already follow a colon inside the same literal can be fixed up front
+            literal = _COLON_DASH.sub(": ", literal)
+            match = _LEADING_DASH.match(literal)
+            dash_stripped = literal[match.end():] if match else None
+
+            if field_name is not None:
+                # Plain names only: attribute/index access depends on the value's type,
+                # so it could pass here and still fail on render
+                if field_name not in TEMPLATE_FIELDS:
+                    raise InvalidTemplateError(f"{{{field_name}}}")
+                if conversion and conversion not in _CONVERSIONS:
+                    raise InvalidTemplateError(f"{{{field_name}!{conversion}}}")
+                if spec and not _valid_str_spec(spec, field_name, conversion):
+                    raise InvalidTemplateError(f"{{{field_name}:{spec}}}")
+                if field_name not in fields:
+                    fields.append(field_name)
+
+            self.pieces.append((
+                literal,
+                dash_stripped,
+                field_name,
+                _CONVERSIONS.get(conversion, str),
+                spec or "",
+            ))
+
+        self.fields = tuple(fields)
+
+    def render(self, values: dict) -> str:
+        out = ""
+        skip_ws = False  # Whitespace after a removed dash is dropped, as the regex did
+        for literal, dash_stripped, field_name, convert, spec in self.pieces:
+            if dash_stripped is not None:
+                head = out.rstrip()
+                if not head:
+                    out, literal, skip_ws = "", dash_stripped, True
+                elif head.endswith(":"):
+                    out, literal, skip_ws = head + " ", dash_stripped, True
+
+            if field_name is not None:
+                literal += format(convert(values[field_name]), spec)
+
+            if skip_ws:
+                literal = literal.lstrip()
+                skip_ws = not literal
+            out += literal
+        return out.strip()
+
+
+@lru_cache(maxsize=32)
+def compile_template(template: str) -> PlaybackTemplate:
+    """Parse a playback_format, raising InvalidTemplateError on bad placeholders."""
+    return PlaybackTemplate(template)
@@ -0,0 +1,124 @@
+import aiohttp
+import asyncio
+import logging
+
+from .breaker import describe_error
+from .const import DOMAIN, WS_SESSIONS_INTERVAL_MS, WS_RECONNECT_MIN, WS_RECONNECT_MAX
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class JellyfinWebSocket:
+    """Subscribes to Jellyfin's /socket session feed and pushes it into the coordinator."""
+
+    def __init__(self, hass, coordinator, device_id: str):
+        self.hass = hass
+        self.coordinator = coordinator
+        self.device_id = device_id
+        self._task = None
+        self._ws = None
+        self._delay = WS_RECONNECT_MIN
+
+    @property
+    def url(self) -> str:
+        protocol = "wss" if self.coordinator.use_https else "ws"
+        return (
+            f"{protocol}://{self.coordinator.address}/socket"
+            f"?api_key={self.coordinator.api_key}&deviceId={self.device_id}"
+        )
+
+    def start(self, entry) -> None:
+        """Start the connect/listen/reconnect loop as a background task of the config entry.
+
+        Home Assistant cancels it on unload and at shutdown.
+        """
+        if self._task is None:
+            self._task = entry.async_create_background_task(
+                self.hass, self._run(), f"{DOMAIN} websocket {entry.entry_id}"
+            )
+
+    @property
+    def _client_closed(self) -> bool:
+        return self.coordinator.client is None or self.coordinator.session.closed
+
+    async def async_stop(self) -> None:
+        """Stop listening and close the socket."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._ws is not None and not self._ws.closed:
+            await self._ws.close()
+        self._ws = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self._listen()
+                _LOGGER.debug("🔌 Jellyfin WebSocket closed by server")
+            except asyncio.CancelledError:
+                # Unloading: no fallback refresh wanted
+                self.coordinator.push_active = False
+                raise
+            except Exception as err:
+                _LOGGER.warning("🔌 Jellyfin WebSocket error: %s", describe_error(err))
+
+            self._ws = None
+            if self._client_closed:
+                # Shared HTTP client released (unload or shutdown): nothing left to reconnect with
+                self.coordinator.push_active = False
+                _LOGGER.debug("🔌 Jellyfin HTTP client closed, stopping WebSocket")
+                return
+            self.coordinator.set_push_active(False)
+
+            _LOGGER.debug("🔁 Reconnecting Jellyfin WebSocket in %ss", self._delay)
+            await asyncio.sleep(self._delay)
+            self._delay = min(self._delay * 2, WS_RECONNECT_MAX)
+            if self._client_closed:
+                self.coordinator.push_active = False
+                return
+
+    async def _listen(self):
+        keepalive = None
+        ssl_context = await self.coordinator.async_ssl_context()
+        async with self.coordinator.session.ws_connect(self.url, heartbeat=30, ssl=ssl_context) as ws:
+            self._ws = ws
+            # Data is "<initial delay ms>,<interval ms>"
+            await ws.send_json({"MessageType": "SessionsStart", "Data": f"0,{WS_SESSIONS_INTERVAL_MS}"})
+            self.coordinator.set_push_active(True)
+            self._delay = WS_RECONNECT_MIN
+
+            try:
+                async for msg in ws:
+                    if msg.type != aiohttp.WSMsgType.TEXT:
+                        if msg.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.ERROR):
+                            break
+                        continue
+
+                    message = await self.coordinator.async_decode_json(msg.data)
+                    message_type = message.get("MessageType")
+
+                    if message_type == "Sessions":
+                        if self.coordinator.capture is not None:
+                            self.coordinator.capture.add("sessions_push", msg.data)
+                        self.coordinator.async_set_sessions(message.get("Data") or [])
+                    elif message_type == "LibraryChanged":
+                        self.coordinator.async_library_changed()
+                    elif message_type == "ForceKeepAlive" and keepalive is None:
+                        # Server expects a KeepAlive at least every Data seconds
+                        interval = max(float(message.get("Data") or 60) / 2, 1)
+                        keepalive = self.hass.loop.create_task(self._keepalive(ws, interval))
+            finally:
+                if keepalive is not None:
+                    keepalive.cancel()
+
+    async def _keepalive(self, ws, interval: float):
+        while not ws.closed:
+            await asyncio.sleep(interval)
+            try:
+                await ws.send_json({"MessageType": "KeepAlive"})
+            except (ConnectionResetError, RuntimeError):
+                return
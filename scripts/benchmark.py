@@ -0,0 +1,302 @@
+"""Offline benchmark of the coordinator → sensor hot path.
+
+Times one poll end to end against synthetic /Sessions and /Items/Counts
+payloads, without a network or a running Home Assistant (a small stub
+stands in for hass; the homeassistant package itself must be installed):
+
+    python scripts/benchmark.py --sessions 1 10 50 --streams 4 40
+
+Measured per scenario, in microseconds per call (median of the repeats):
+
+    coordinator_update       _async_update_data: decode + parse, warm item cache
+    coordinator_update_cold  the same with the item cache cleared every call
+    attributes_rebuild       extra_state_attributes after new data arrived
+    attributes_cached        extra_state_attributes for an unchanged revision
+    native_value             native_value for an unchanged revision
+    format_position          _format_position on a single tick value
+
+Use --save-baseline to record the results in benchmark_baseline.json next
+to this script, and --max-regression to fail when a metric got slower than
+that baseline by more than the given percentage.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.jellyfin_status.const import (  # noqa: E402
+    DEFAULT_PLAYBACK_FORMAT,
+    ENDPOINT_COUNTS,
+    ENDPOINT_SESSIONS,
+)
+from custom_components.jellyfin_status.coordinator import JellyfinCoordinator  # noqa: E402
+from custom_components.jellyfin_status.sensor import JellyfinSensor  # noqa: E402
+from homeassistant.core import CoreState  # noqa: E402
+
+BASELINE_PATH = Path(__file__).with_name("benchmark_baseline.json")
+
+USERS = ["Homer", "Marge", "Bart", "Lisa", "Maggie", "Ned", "Moe", "Apu"]
+DEVICES = [("Chrome", "Jellyfin Web"), ("NCC-1701-D", "Jellyfin Media Player"), ("Living Room", "Jellyfin Android TV")]
+COUNTS = {"MovieCount": 519, "SeriesCount": 61, "EpisodeCount": 2259, "AlbumCount": 440, "SongCount": 8848}
+TICKS_PER_SECOND = 10_000_000
+
+
+# --- Payload generator ---
+
+def _streams(media_type: str, count: int, rng: random.Random) -> list[dict]:
+    """A video stream (unless audio), then audio and subtitle streams up to count."""
+    streams = []
+    if media_type != "Audio":
+        streams.append({
+            "Type": "Video", "Codec": "hevc", "Width": rng.choice([1280, 1920, 3840]), "Height": 2160,
+            "VideoRange": rng.choice(["SDR", "HDR"]), "BitRate": 40_000_000, "Profile": "Main 10",
+            "DisplayTitle": "4K HEVC HDR", "Index": 0, "IsDefault": True,
+        })
+    while len(streams) < count:
+        index = len(streams)
+        if index % 2:
+            streams.append({
+                "Type": "Audio", "Codec": rng.choice(["ac3", "eac3", "dts", "flac", "aac"]),
+                "Channels": rng.choice([2, 6, 8]), "Language": "eng", "BitRate": 640_000,
+                "DisplayTitle": "English - Dolby Digital - 5.1", "Index": index, "IsDefault": index == 1,
+            })
+        else:
+            streams.append({
+                "Type": "Subtitle", "Codec": "subrip", "Language": "eng", "DisplayTitle": "English - SUBRIP",
+                "Index": index, "IsExternal": False, "IsTextSubtitleStream": True,
+            })
+    return streams
+
+
+def make_item(index: int, media_type: str, stream_count: int, rng: random.Random) -> dict:
+    """A NowPlayingItem with the bulk a real server sends (people, chapters, overview)."""
+    runtime = rng.randint(3, 150) * 60 * TICKS_PER_SECOND
+    item = {
+        "Id": f"item{index:05}",
+        "Name": f"{media_type} {index}",
+        "Type": media_type,
+        "RunTimeTicks": runtime,
+        "ProductionYear": rng.randint(1970, 2025),
+        "OfficialRating": "US:PG-13 / Rated PG-13",
+        "DateLastSaved": "2025-01-01T00:00:00.0000000Z",
+        "Overview": "Lorem ipsum dolor sit amet. " * 20,
+        "People": [{"Name": f"Actor {n}", "Role": f"Role {n}", "Type": "Actor", "Id": f"p{n}"} for n in range(20)],
+        "Chapters": [{"StartPositionTicks": n * 300 * TICKS_PER_SECOND, "Name": f"Chapter {n}"} for n in range(12)],
+        "ExternalUrls": [{"Name": "IMDb", "Url": "https://www.imdb.com/"}],
+        "MediaStreams": _streams(media_type, stream_count, rng),
+    }
+    if media_type == "Episode":
+        item.update({"SeriesName": f"Series {index % 7}", "ParentIndexNumber": 1 + index % 5, "IndexNumber": 1 + index % 12})
+    elif media_type == "Audio":
+        item.update({"Artists": [f"Artist {index % 9}"], "AlbumArtist": f"Artist {index % 9}"})
+    return item
+
+
+def make_sessions(count: int, mix: dict[str, int], transcode_ratio: float, stream_count: int, seed: int = 0) -> list[dict]:
+    """Active /Sessions entries, media types drawn from mix weights."""
+    rng = random.Random(seed)
+    media_types = list(mix)
+    weights = [mix[media_type] for media_type in media_types]
+    sessions = []
+    for index in range(count):
+        media_type = rng.choices(media_types, weights)[0]
+        item = make_item(index, media_type, stream_count, rng)
+        device, client = DEVICES[index % len(DEVICES)]
+        transcoding = rng.random() < transcode_ratio
+        session = {
+            "Id": f"session{index:05}",
+            "UserName": USERS[index % len(USERS)],
+            "DeviceName": device,
+            "Client": client,
+            "ApplicationVersion": "10.10.0",
+            "Capabilities": {"PlayableMediaTypes": ["Audio", "Video"], "SupportedCommands": ["Play"] * 30},
+            "NowPlayingItem": item,
+            "PlayState": {
+                "PositionTicks": rng.randint(0, item["RunTimeTicks"]),
+                "IsPaused": rng.random() < 0.2,
+                "PlayMethod": "Transcode" if transcoding else "DirectPlay",
+                "CanSeek": True,
+            },
+        }
+        if transcoding:
+            session["TranscodingInfo"] = {
+                "Framerate": rng.uniform(20, 120),
+                "CompletionPercentage": rng.uniform(0, 100),
+                "TranscodeReasons": ["VideoCodecNotSupported", "AudioCodecNotSupported"],
+            }
+        sessions.append(session)
+    return sessions
+
+
+# --- Stub hass ---
+
+class StubBus:
+    def async_listen(self, *args, **kwargs):
+        return lambda: None
+
+    async_listen_once = async_listen
+
+    def async_fire(self, *args, **kwargs):
+        pass
+
+
+class StubHass:
+    """Just enough of HomeAssistant for the coordinator and sensor to run offline."""
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.data = {}
+        self.bus = StubBus()
+        self.config = SimpleNamespace(language="en")
+        self.state = CoreState.running
+
+    async def async_add_executor_job(self, target, *args):
+        return await self.loop.run_in_executor(None, target, *args)
+
+    def async_create_task(self, target, *args, **kwargs):
+        return self.loop.create_task(target)
+
+
+# --- Timing ---
+
+def make_coordinator(hass, entry, **kwargs) -> JellyfinCoordinator:
+    """A coordinator without the warm-start Store, which needs a real hass to write."""
+    coordinator = JellyfinCoordinator(hass, entry, **kwargs)
+    coordinator._store = None
+    return coordinator
+
+
+def _median_us(samples: list[float], number: int) -> float:
+    return round(statistics.median(samples) / number * 1_000_000, 2)
+
+
+def time_sync(func, number: int, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append(time.perf_counter() - start)
+    return _median_us(samples, number)
+
+
+async def time_async(func, number: int, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            await func()
+        samples.append(time.perf_counter() - start)
+    return _median_us(samples, number)
+
+
+async def run_scenario(session_count: int, stream_count: int, args) -> dict[str, float]:
+    hass = StubHass(asyncio.get_running_loop())
+    bodies = {
+        ENDPOINT_SESSIONS: json.dumps(make_sessions(session_count, args.mix, args.transcode_ratio, stream_count)).encode(),
+        ENDPOINT_COUNTS: json.dumps(COUNTS).encode(),
+    }
+    entry = SimpleNamespace(
+        entry_id="benchmark",
+        title="Benchmark",
+        data={},
+        options={"playback_format": DEFAULT_PLAYBACK_FORMAT, "idle_message": "Idle"},
+    )
+    coordinator = make_coordinator(hass, entry, api_key="x", address="127.0.0.1:8096", update_interval=None)
+
+    async def fetch(endpoint):
+        return await coordinator.async_decode_json(bodies[endpoint])
+
+    coordinator._fetch_endpoint = fetch
+    try:
+        coordinator.data = await coordinator._async_update_data()
+        sensor = JellyfinSensor(coordinator, entry, lambda entities: None)
+
+        async def update_cold():
+            coordinator.item_cache.clear()
+            await coordinator._async_update_data()
+
+        def attributes_rebuild():
+            coordinator.data_revision += 1
+            return sensor.extra_state_attributes
+
+        ticks = 5_025 * TICKS_PER_SECOND
+        return {
+            "coordinator_update": await time_async(coordinator._async_update_data, args.number, args.repeat),
+            "coordinator_update_cold": await time_async(update_cold, args.number, args.repeat),
+            "attributes_rebuild": time_sync(attributes_rebuild, args.number, args.repeat),
+            "attributes_cached": time_sync(lambda: sensor.extra_state_attributes, args.number, args.repeat),
+            "native_value": time_sync(lambda: sensor.native_value, args.number, args.repeat),
+            "format_position": time_sync(lambda: sensor._format_position(ticks), args.number, args.repeat),
+        }
+    finally:
+        await coordinator.async_close()
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    """'Movie=1,Episode=2,Audio=1' -> weights per media type."""
+    mix = {}
+    for part in value.split(","):
+        media_type, _, weight = part.partition("=")
+        mix[media_type.strip()] = int(weight or 1)
+    return mix
+
+
+async def run(args) -> int:
+    results = {}
+    for session_count, stream_count in itertools.product(args.sessions, args.streams):
+        name = f"sessions={session_count},streams={stream_count}"
+        results[name] = await run_scenario(session_count, stream_count, args)
+
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    regressions = []
+    print(f"{'scenario':<28} {'metric':<24} {'µs/call':>12} {'baseline':>12} {'change':>8}")
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            base = baseline.get(name, {}).get(metric)
+            change = f"{(value - base) / base * 100:+.1f}%" if base else ""
+            print(f"{name:<28} {metric:<24} {value:>12.2f} {base if base is not None else '':>12} {change:>8}")
+            if base and args.max_regression is not None and value > base * (1 + args.max_regression / 100):
+                regressions.append(f"{name} {metric}")
+
+    if args.save_baseline:
+        # Timings only compare on the same machine; _meta records how they were produced
+        meta = {
+            "command": " ".join(["python", "scripts/benchmark.py", *sys.argv[1:]]),
+            "python": platform.python_version(),
+            "machine": f"{platform.system()} {platform.machine()}",
+        }
+        BASELINE_PATH.write_text(json.dumps({"_meta": meta, **results}, indent=2) + "\n")
+        print(f"Baseline written to {BASELINE_PATH}")
+
+    if regressions:
+        print("Slower than baseline by more than {}%: {}".format(args.max_regression, ", ".join(regressions)))
+        return 1
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 50], help="active session counts to run")
+    parser.add_argument("--streams", type=int, nargs="+", default=[4, 40], help="MediaStreams per item")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("Movie=1,Episode=1,Audio=1"), help="media type weights")
+    parser.add_argument("--transcode-ratio", type=float, default=0.3, help="share of sessions that transcode")
+    parser.add_argument("--number", type=int, default=200, help="calls per repeat")
+    parser.add_argument("--repeat", type=int, default=5, help="repeats per metric (the median is reported)")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--max-regression", type=float, default=None, help="exit 1 if a metric is this many %% slower than baseline")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""Local stand-in for a Jellyfin server, for testing Jellyfin Status offline.
+
+Serves the REST endpoints the integration polls and the /socket WebSocket
+session feed, so both polling and push mode can be exercised without a
+real server:
+
+    python scripts/fake_jellyfin.py --port 8096 --sessions 3
+
+Point the integration at localhost:8096 with any API key. Use
+--drop-socket-after to close WebSocket connections after N seconds and
+check the fallback to REST polling.
+
+Faults for load and soak testing (see scripts/soak.py) can be injected
+into every REST response:
+
+    python scripts/fake_jellyfin.py --sessions 20 --churn 6 --latency 0.2 \
+        --error-401 0.01 --error-5xx 0.05 --slow-body 0.02 --truncate 0.02
+
+Payloads dumped with the integration's jellyfin_status.dump_payloads
+service can be served back, in capture order, with --replay FILE.
+"""
+import argparse
+import asyncio
+import json
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from aiohttp import web, WSMsgType
+
+SERVER_VERSION = "10.10.0"
+
+USERS = ["Homer", "Marge", "Bart", "Lisa", "Maggie"]
+DEVICES = [("Chrome", "Jellyfin Web"), ("NCC-1701-D", "Jellyfin Media Player"), ("Living Room", "Jellyfin Android TV")]
+ITEMS = [
+    {"Id": "m1", "Type": "Movie", "Name": "The Amazing Spider-Man", "OfficialRating": "PG-13", "ProductionYear": 2012,
+     "RunTimeTicks": 81770000000,
+     "MediaStreams": [{"Type": "Video", "Width": 1920, "VideoRange": "SDR"}, {"Type": "Audio", "Codec": "ac3", "Channels": 6}]},
+    {"Id": "e1", "Type": "Episode", "Name": "Death by Misadventure", "SeriesName": "Chucky", "ParentIndexNumber": 1,
+     "IndexNumber": 1, "ProductionYear": 2021, "RunTimeTicks": 27880000000,
+     "MediaStreams": [{"Type": "Video", "Width": 3840, "VideoRange": "HDR"}, {"Type": "Audio", "Codec": "eac3", "Channels": 8}]},
+    {"Id": "a1", "Type": "Audio", "Name": "One Vision", "Artists": ["Queen"], "AlbumArtist": "Queen", "ProductionYear": 2009,
+     "RunTimeTicks": 2440000000, "MediaStreams": [{"Type": "Audio", "Codec": "flac", "Channels": 2}]},
+]
+COUNTS = {"MovieCount": 519, "SeriesCount": 61, "EpisodeCount": 2259, "AlbumCount": 440, "SongCount": 8848}
+# Media folders: (ItemId, Name, CollectionType, items, added in the last week)
+LIBRARIES = [("lib1", "Movies", "movies", 519, 3), ("lib2", "Shows", "tvshows", 2259, 12), ("lib3", "Music", "music", 8848, 0)]
+
+
+class FakeJellyfin:
+    """In-memory sessions that advance their play position over time."""
+
+    def __init__(
+        self,
+        session_count: int,
+        drop_socket_after: float | None = None,
+        churn: float = 0,
+        latency: float = 0,
+        error_401: float = 0,
+        error_5xx: float = 0,
+        slow_body: float = 0,
+        truncate: float = 0,
+        replay: dict | None = None,
+    ):
+        self.drop_socket_after = drop_socket_after
+        self.churn = churn  # Sessions replaced per minute
+        self.latency = latency  # Seconds added to each REST response (±50% jitter)
+        self.error_401 = error_401  # Probabilities per REST response
+        self.error_5xx = error_5xx
+        self.slow_body = slow_body
+        self.truncate = truncate
+        self.sessions = [self._new_session(i) for i in range(session_count)]
+        self.requests = 0
+        self.replay = replay or {}  # endpoint -> captured payloads, served in turn
+        self._replay_index = {}
+
+    def _new_session(self, index: int) -> dict:
+        device, client = DEVICES[index % len(DEVICES)]
+        item = dict(ITEMS[index % len(ITEMS)])
+        return {
+            "Id": uuid.uuid4().hex,
+            "UserName": USERS[index % len(USERS)],
+            "DeviceName": device,
+            "Client": client,
+            "ApplicationVersion": SERVER_VERSION,
+            "NowPlayingItem": item,
+            "PlayState": {
+                "PositionTicks": random.randint(0, item["RunTimeTicks"] // 2),
+                "IsPaused": False,
+                "PlayMethod": "DirectPlay",
+            },
+        }
+
+    def tick(self, seconds: float) -> None:
+        # Churn: sessions stop and new ones start in their place
+        if self.sessions and random.random() < self.churn * seconds / 60:
+            index = random.randrange(len(self.sessions))
+            self.sessions[index] = self._new_session(random.randrange(len(USERS)))
+
+        for session in self.sessions:
+            play_state = session["PlayState"]
+            if not play_state["IsPaused"]:
+                runtime = session["NowPlayingItem"]["RunTimeTicks"]
+                play_state["PositionTicks"] = (play_state["PositionTicks"] + int(seconds * 10_000_000)) % runtime
+
+    def _replayed(self, endpoint: str, default):
+        payloads = self.replay.get(endpoint)
+        if not payloads:
+            return default
+        index = self._replay_index.get(endpoint, 0)
+        self._replay_index[endpoint] = (index + 1) % len(payloads)
+        return payloads[index]
+
+    # --- REST ---
+    async def _respond(self, request, payload):
+        """JSON response with the configured latency and faults applied."""
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency * random.uniform(0.5, 1.5))
+        if random.random() < self.error_401:
+            return web.Response(status=401, text="Unauthorized")
+        if random.random() < self.error_5xx:
+            return web.Response(status=random.choice([500, 502, 503]), text="Server error")
+
+        body = json.dumps(payload).encode()
+        slow = random.random() < self.slow_body
+        truncated = random.random() < self.truncate
+        if not slow and not truncated:
+            return web.Response(body=body, content_type="application/json")
+
+        # Stream the body in chunks; slow bodies trickle in, truncated ones stop halfway
+        response = web.StreamResponse(headers={"Content-Type": "application/json"})
+        response.content_length = len(body)
+        await response.prepare(request)
+        end = len(body) // 2 if truncated else len(body)
+        chunk = max(end // 20, 1)
+        for start in range(0, end, chunk):
+            await response.write(body[start:min(start + chunk, end)])
+            if slow:
+                await asyncio.sleep(0.5)
+        if truncated:
+            request.transport.close()
+        return response
+
+    async def handle_sessions(self, request):
+        return await self._respond(request, self._replayed("sessions", self.sessions))
+
+    async def handle_counts(self, request):
+        return await self._respond(request, self._replayed("counts", COUNTS))
+
+    async def handle_libraries(self, request):
+        folders = [{"ItemId": item_id, "Name": name, "CollectionType": kind} for item_id, name, kind, _, _ in LIBRARIES]
+        return await self._respond(request, self._replayed("libraries", folders))
+
+    async def handle_items(self, request):
+        """Just the newest-first page the library statistics ask for."""
+        library = next((lib for lib in LIBRARIES if lib[0] == request.query.get("ParentId")), None)
+        total, recent = library[3:] if library else (0, 0)
+        now = datetime.now(timezone.utc)
+        items = [
+            {"DateCreated": (now - timedelta(days=index * 7 / (recent + 1))).isoformat().replace("+00:00", "Z")}
+            for index in range(recent)
+        ]
+        items.append({"DateCreated": "2020-01-01T00:00:00.0000000Z"})
+        return await self._respond(request, {"TotalRecordCount": total, "Items": items})
+
+    async def handle_system_info(self, request):
+        return await self._respond(request, {"ServerName": "Fake Jellyfin", "Version": SERVER_VERSION, "Id": "fake"})
+
+    # --- WebSocket ---
+    async def handle_socket(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        await ws.send_json({"MessageType": "ForceKeepAlive", "Data": 60})
+
+        feed = None
+        loop = asyncio.get_running_loop()
+        if self.drop_socket_after:
+            loop.call_later(self.drop_socket_after, lambda: asyncio.ensure_future(ws.close()))
+
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                message = json.loads(msg.data)
+                message_type = message.get("MessageType")
+                if message_type == "SessionsStart":
+                    initial_ms, interval_ms = (int(v) for v in message.get("Data", "0,1500").split(","))
+                    if feed:
+                        feed.cancel()
+                    feed = loop.create_task(self._feed(ws, initial_ms / 1000, interval_ms / 1000))
+                elif message_type == "SessionsStop" and feed:
+                    feed.cancel()
+                    feed = None
+        finally:
+            if feed:
+                feed.cancel()
+        return ws
+
+    async def _feed(self, ws, initial: float, interval: float):
+        await asyncio.sleep(initial)
+        while not ws.closed:
+            await ws.send_json({"MessageType": "Sessions", "Data": self._replayed("sessions", self.sessions)})
+            await asyncio.sleep(interval)
+
+    async def _clock(self, app):
+        async def run():
+            while True:
+                await asyncio.sleep(1)
+                self.tick(1)
+        task = asyncio.create_task(run())
+        yield
+        task.cancel()
+
+    def make_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/Sessions", self.handle_sessions)
+        app.router.add_get("/Items/Counts", self.handle_counts)
+        app.router.add_get("/Library/VirtualFolders", self.handle_libraries)
+        app.router.add_get("/Items", self.handle_items)
+        app.router.add_get("/System/Info/Public", self.handle_system_info)
+        app.router.add_get("/socket", self.handle_socket)
+        app.cleanup_ctx.append(self._clock)
+        return app
+
+
+def load_fixture(path: str) -> dict:
+    """Read a dump_payloads file into endpoint -> payloads for replay."""
+    with open(path, encoding="utf-8") as f:
+        fixture = json.load(f)
+    replay = {"sessions": [], "counts": []}
+    for record in fixture.get("captured", []):
+        endpoint = record.get("endpoint")
+        if endpoint == "sessions_push":
+            replay["sessions"].append(record["payload"].get("Data") or [])
+        elif endpoint in replay:
+            replay[endpoint].append(record["payload"])
+    return replay
+
+
+def add_fault_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--churn", type=float, default=0, help="sessions replaced per minute")
+    parser.add_argument("--latency", type=float, default=0, help="seconds added to each REST response")
+    parser.add_argument("--error-401", type=float, default=0, help="share of REST responses that are 401")
+    parser.add_argument("--error-5xx", type=float, default=0, help="share of REST responses that are 5xx")
+    parser.add_argument("--slow-body", type=float, default=0, help="share of bodies sent slowly in chunks")
+    parser.add_argument("--truncate", type=float, default=0, help="share of bodies cut off halfway")
+
+
+def fault_options(args) -> dict:
+    return {
+        "churn": args.churn,
+        "latency": args.latency,
+        "error_401": args.error_401,
+        "error_5xx": args.error_5xx,
+        "slow_body": args.slow_body,
+        "truncate": args.truncate,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8096)
+    parser.add_argument("--sessions", type=int, default=3, help="number of active sessions")
+    parser.add_argument("--drop-socket-after", type=float, default=None, help="close WebSocket connections after N seconds")
+    parser.add_argument("--replay", default=None, help="serve payloads from a dump_payloads file")
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+
+    server = FakeJellyfin(
+        args.sessions,
+        drop_socket_after=args.drop_socket_after,
+        replay=load_fixture(args.replay) if args.replay else None,
+        **fault_options(args),
+    )
+    web.run_app(server.make_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
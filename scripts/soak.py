@@ -0,0 +1,146 @@
+"""Soak test: N coordinators polling the fake Jellyfin server for a while.
+
+Starts scripts/fake_jellyfin.py in-process with the requested faults,
+then polls it from N JellyfinCoordinator instances (stub hass, as in
+scripts/benchmark.py; the homeassistant package must be installed) and
+reports:
+
+    poll latency         per-poll wall time, p50 / p95 / max
+    error recovery time  first failed poll until the next successful one
+    event-loop blocking  how late a 10 ms timer fires, p99 / max
+
+Example, eight servers at 5 s with adaptive polling and 5% server errors:
+
+    python scripts/soak.py --coordinators 8 --scan-interval 5 --adaptive \\
+        --duration 600 --sessions 20 --churn 6 --error-5xx 0.05 --truncate 0.01
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+
+from aiohttp import web
+
+from benchmark import StubHass, make_coordinator  # Also puts the repository root on sys.path
+from fake_jellyfin import FakeJellyfin, add_fault_arguments, fault_options
+
+from custom_components.jellyfin_status.coordinator import JellyfinCoordinator
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+LOOP_PROBE_INTERVAL = 0.01
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[int(percent) - 1]
+
+
+async def probe_loop(lags: list[float], stop: asyncio.Event) -> None:
+    """Record how late a short sleep wakes up; anything large means the loop was blocked."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(LOOP_PROBE_INTERVAL)
+        lags.append(loop.time() - start - LOOP_PROBE_INTERVAL)
+
+
+async def drive(coordinator: JellyfinCoordinator, stats: dict, stop: asyncio.Event) -> None:
+    """Poll like the coordinator's own timer would, honouring the delay it asks for."""
+    failed_since = None
+    while not stop.is_set():
+        start = time.monotonic()
+        try:
+            coordinator.data = await coordinator._async_update_data()
+        except UpdateFailed:
+            stats["errors"] += 1
+            if failed_since is None:
+                failed_since = start
+        else:
+            if failed_since is not None:
+                stats["recoveries"].append(time.monotonic() - failed_since)
+                failed_since = None
+        stats["latencies"].append(time.monotonic() - start)
+        stats["polls"] += 1
+
+        delay = coordinator.update_interval.total_seconds() if coordinator.update_interval else 1
+        try:
+            await asyncio.wait_for(stop.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run(args) -> None:
+    server = FakeJellyfin(args.sessions, **fault_options(args))
+    runner = web.AppRunner(server.make_app())
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", args.port).start()
+
+    hass = StubHass(asyncio.get_running_loop())
+    coordinators = []
+    for index in range(args.coordinators):
+        entry = SimpleNamespace(entry_id=f"soak{index}", title=f"Soak {index}", data={}, options={})
+        coordinators.append(make_coordinator(
+            hass,
+            entry,
+            api_key="soak",
+            address=f"127.0.0.1:{args.port}",
+            update_interval=timedelta(seconds=args.scan_interval),
+            adaptive_polling=args.adaptive,
+        ))
+
+    stop = asyncio.Event()
+    stats = {"polls": 0, "errors": 0, "latencies": [], "recoveries": []}
+    lags = []
+    tasks = [asyncio.create_task(probe_loop(lags, stop))]
+    tasks += [asyncio.create_task(drive(coordinator, stats, stop)) for coordinator in coordinators]
+
+    print(f"Soaking {args.coordinators} coordinators for {args.duration}s...")
+    await asyncio.sleep(args.duration)
+    stop.set()
+    await asyncio.gather(*tasks)
+
+    for coordinator in coordinators:
+        await coordinator.async_close()
+    await runner.cleanup()
+
+    latencies_ms = [value * 1000 for value in stats["latencies"]]
+    lags_ms = [value * 1000 for value in lags]
+    recoveries = stats["recoveries"]
+    print(f"Server requests:      {server.requests}")
+    print(f"Polls / failed:       {stats['polls']} / {stats['errors']}")
+    print(
+        "Poll latency (ms):    p50 {:.1f}  p95 {:.1f}  max {:.1f}".format(
+            _percentile(latencies_ms, 50), _percentile(latencies_ms, 95), max(latencies_ms, default=0)
+        )
+    )
+    print(
+        "Error recovery (s):   count {}  mean {:.1f}  max {:.1f}".format(
+            len(recoveries), statistics.fmean(recoveries) if recoveries else 0, max(recoveries, default=0)
+        )
+    )
+    print(
+        "Loop blocking (ms):   p99 {:.1f}  max {:.1f}  over 50 ms: {}".format(
+            _percentile(lags_ms, 99), max(lags_ms, default=0), sum(1 for lag in lags_ms if lag > 50)
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--coordinators", type=int, default=4, help="number of simulated config entries")
+    parser.add_argument("--duration", type=float, default=300, help="seconds to run")
+    parser.add_argument("--scan-interval", type=int, default=5, help="scan_interval of every coordinator")
+    parser.add_argument("--adaptive", action="store_true", help="enable adaptive polling")
+    parser.add_argument("--port", type=int, default=18096, help="port for the in-process fake server")
+    parser.add_argument("--sessions", type=int, default=3, help="number of active sessions")
+    add_fault_arguments(parser)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()